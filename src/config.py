@@ -1,3 +1,6 @@
+from types import SimpleNamespace
+from typing import NamedTuple
+
 # Window settings (visible area)
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
@@ -19,28 +22,54 @@ CAMERA_SETTINGS = {
 }
 
 # Plant configuration
-PLANT_CONFIG = {
-    "initial_count": 100,
-    "min_spacing": 50,
-    "bounds_padding": 50,
-    "seed_min_distance": 40,
-    "seed_range": 500,
-    "max_growth_level": 4,
-    "max_growth_timer": 10,
-    "reproduction_delay": 20,
-    "growth_textures": [
+class ReproductionConfig(NamedTuple):
+    factor: float
+    max_fails: int
+    max_successes: int
+
+
+class PlantConfig(NamedTuple):
+    initial_count: int
+    min_spacing: int
+    bounds_padding: int
+    seed_min_distance: int
+    seed_range: int
+    max_growth_level: int
+    max_growth_timer: int
+    reproduction_delay: int
+    growth_textures: tuple[str, ...]
+    reproduction: ReproductionConfig
+    provided_energy: tuple[int, ...]
+
+
+PLANT_CONFIG = PlantConfig(
+    initial_count=100,
+    min_spacing=50,
+    bounds_padding=50,
+    seed_min_distance=40,
+    seed_range=500,
+    max_growth_level=4,
+    max_growth_timer=10,
+    reproduction_delay=20,
+    growth_textures=(
         "plant_stage_1",
         "plant_stage_2",
         "plant_stage_3",
         "plant_stage_4",
-    ],
-    "reproduction": {
-        "factor": 1.2,
-        "max_fails": 5,
-        "max_successes": 3,
-    },
-    "provided_energy": [10, 20, 30, 50]
-}
+    ),
+    reproduction=ReproductionConfig(
+        factor=1.2,
+        max_fails=5,
+        max_successes=3,
+    ),
+    provided_energy=(10, 20, 30, 50),
+)
+
+# Plant values read on the spawn hot path
+PLANT_BOUNDS_PADDING = PLANT_CONFIG.bounds_padding
+PLANT_MIN_SPACING = PLANT_CONFIG.min_spacing
+PLANT_MIN_SPACING_SQ = PLANT_MIN_SPACING * PLANT_MIN_SPACING
+PLANT_MAX_GROWTH_LEVEL = PLANT_CONFIG.max_growth_level
 
 # Walking creature configuration
 WALKING_CREATURE_CONFIG = {
@@ -54,6 +83,7 @@ WALKING_CREATURE_CONFIG = {
         "reproduction_energy_threshold": 100,  # Default energy threshold for reproduction
         "reproduction_delay": 5.0,          # Default seconds between reproductions
         "energy_cost_reproduction": 25,     # Default energy cost for reproduction
+        "turn_interval": 2.0,               # Seconds between random heading changes while wandering
     },
     "herbivore": {
         "vision_range": 200,
@@ -78,6 +108,13 @@ WALKING_CREATURE_CONFIG = {
     },
 }
 
+# Resolve each species against the defaults once, so lookups need no fallback logic
+_WALKING_CREATURE_DEFAULTS = WALKING_CREATURE_CONFIG["default"]
+WALKING_CREATURE_CONFIG = {
+    species: SimpleNamespace(**{**_WALKING_CREATURE_DEFAULTS, **overrides})
+    for species, overrides in WALKING_CREATURE_CONFIG.items()
+}
+
 # Physics settings
 DEFAULT_DAMPING = .6
 GRAVITY = (0, 0)
\ No newline at end of file
@@ -2,6 +2,7 @@ import arcade
 
 
 class Entity(arcade.Sprite):
+    __slots__ = ("entity_manager",)
 
     def __init__(self, texture, x, y, *args, **kwargs):
         super().__init__(
@@ -13,3 +14,20 @@ class Entity(arcade.Sprite):
             **kwargs,
         )
 
+    @classmethod
+    def lazy_texture(cls, attr, load):
+        """
+        Return the texture(s) in class attribute attr, shared by every instance,
+        calling load() to fill it on first use. Textures can only be created once
+        the window (and its GL context) exists, so they can't be loaded at import.
+        """
+        texture = getattr(cls, attr)
+        if texture is None:
+            texture = load()
+            setattr(cls, attr, texture)
+        return texture
+
+    def despawn(self):
+        """Remove the entity from its sprite lists and physics engines."""
+        # Sprites keep their own list of physics engines, so no engine-side membership scan is needed
+        self.remove_from_sprite_lists()
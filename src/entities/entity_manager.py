@@ -1,11 +1,77 @@
-import random
+from contextlib import contextmanager
 import arcade
-import pymunk
-from config import DEFAULT_DAMPING, GRAVITY, PLANT_CONFIG
+import numpy as np
+from config import DEFAULT_DAMPING, GRAVITY, PLANT_BOUNDS_PADDING
 from entities.plant import Plant
 from entities.herbivore import Herbivore
+from entities.herbivore_system import HerbivoreSystem
+from entities.plant_system import PlantSystem
 
 TILE_SCALING = 1.0
+# Tile layers are drawn in square chunks of this many tiles per side, so only
+# chunks overlapping the camera view are submitted
+TILE_CHUNK_TILES = 16
+MAP_PATH = "assets/maps/uniform_map.json"
+LAYER_OPTIONS = {
+    "ground": {
+        "use_spatial_hash": True
+    },
+    "plants": {
+        "use_spatial_hash": True
+    }
+}
+
+# Parsed tile maps keyed by (path, scaling); restarting the simulation reuses them
+_TILEMAP_CACHE: dict[tuple[str, float], arcade.TileMap] = {}
+
+
+def _get_tilemap(path: str, scaling: float) -> arcade.TileMap:
+    key = (path, scaling)
+    if key not in _TILEMAP_CACHE:
+        _TILEMAP_CACHE[key] = arcade.load_tilemap(path, scaling=scaling, layer_options=LAYER_OPTIONS)
+    return _TILEMAP_CACHE[key]
+
+
+TileChunk = tuple[tuple[float, float, float, float], arcade.SpriteList]
+
+# Chunked copies of each cached tile map's layers, keyed like _TILEMAP_CACHE
+_TILE_CHUNK_CACHE: dict[tuple[str, float], dict[str, list[TileChunk]]] = {}
+
+
+def _chunk_sprite_list(sprite_list: arcade.SpriteList, chunk_size: float) -> list[TileChunk]:
+    """Split a static layer into sprite lists covering chunk_size squares, each with its (l, r, b, t) bounds."""
+    buckets: dict[tuple[int, int], list[arcade.Sprite]] = {}
+    for sprite in sprite_list:
+        key = (int(sprite.center_x // chunk_size), int(sprite.center_y // chunk_size))
+        buckets.setdefault(key, []).append(sprite)
+
+    chunks = []
+    for sprites in buckets.values():
+        # Tiles never change after load: size the buffers exactly, share the layer's
+        # atlas and upload once here so drawing never has to resync them
+        chunk = arcade.SpriteList(atlas=sprite_list.atlas, capacity=len(sprites))
+        chunk.extend(sprites)
+        chunk.write_sprite_buffers_to_gpu()
+        bounds = (
+            min(s.left for s in sprites),
+            max(s.right for s in sprites),
+            min(s.bottom for s in sprites),
+            max(s.top for s in sprites),
+        )
+        chunks.append((bounds, chunk))
+    return chunks
+
+
+def _get_tile_chunks(path: str, scaling: float) -> dict[str, list[TileChunk]]:
+    key = (path, scaling)
+    if key not in _TILE_CHUNK_CACHE:
+        tile_map = _get_tilemap(path, scaling)
+        chunk_size = TILE_CHUNK_TILES * tile_map.tile_width * scaling
+        _TILE_CHUNK_CACHE[key] = {
+            name: _chunk_sprite_list(sprite_list, chunk_size)
+            for name, sprite_list in tile_map.sprite_lists.items()
+        }
+    return _TILE_CHUNK_CACHE[key]
 
 
 class EntityManager():
@@ -14,50 +80,89 @@ class EntityManager():
     to provide entity-specific functionality.
     """
     def __init__(self):
-        layer_options = {
-            "ground": {
-                "use_spatial_hash": True
-            },
-            "plants": {
-                "use_spatial_hash": True
-            }
-        }
-        self.tile_map = arcade.load_tilemap(
-            "assets/maps/uniform_map.json",
-            scaling=TILE_SCALING,
-            layer_options=layer_options
-        )
+        self.tile_map = _get_tilemap(MAP_PATH, TILE_SCALING)
         self.scene = arcade.Scene.from_tilemap(self.tile_map)
         self.scene.physics_engine = arcade.PymunkPhysicsEngine(damping=DEFAULT_DAMPING, gravity=GRAVITY)
+        self.scene.add_sprite_list("plants")
+        self.scene.add_sprite_list("herbivores")
+        # Tile layers are drawn from their chunks; entity layers are drawn whole on top
+        self._tile_chunks = _get_tile_chunks(MAP_PATH, TILE_SCALING)
+        self._entity_layers = (self.scene["plants"], self.scene["herbivores"])
+        self._culled_view: tuple[float, float, float, float] | None = None
+        self._visible_chunks: list[arcade.SpriteList] = []
+        self.herbivore_system = HerbivoreSystem(self.scene.physics_engine)
         self.map_size = self.tile_map.width * self.tile_map.tile_width, self.tile_map.height * self.tile_map.tile_height
-        
-    def handle_seed_drop(self, seed_x: float, seed_y: float, *, growth_level: int = 1) -> bool:
+        self.map_center = (self.map_size[0] / 2, self.map_size[1] / 2)
+        self.plant_system = PlantSystem(self)
+        # Sprites waiting to be added to their layers while a batch_spawn block is open
+        self._pending_sprites: dict[str, list[arcade.Sprite]] | None = None
         map_width, map_height = self.map_size
-        padding = PLANT_CONFIG["bounds_padding"]
-        min_spacing = PLANT_CONFIG["min_spacing"]
-        min_spacing_sq = min_spacing * min_spacing
+        self._seed_bounds = (
+            PLANT_BOUNDS_PADDING,
+            map_width - PLANT_BOUNDS_PADDING,
+            PLANT_BOUNDS_PADDING,
+            map_height - PLANT_BOUNDS_PADDING,
+        )
 
-        if not (padding <= seed_x <= map_width - padding and padding <= seed_y <= map_height - padding):
+    def handle_seed_drop(self, seed_x: float, seed_y: float, *, growth_level: int = 1) -> bool:
+        min_x, max_x, min_y, max_y = self._seed_bounds
+        if not (min_x <= seed_x <= max_x and min_y <= seed_y <= max_y):
+            return False
+        if not self.plant_system.is_clear(seed_x, seed_y):
             return False
-
-        query_bb = pymunk.BB(
-            seed_x - min_spacing,
-            seed_y - min_spacing,
-            seed_x + min_spacing,
-            seed_y + min_spacing,
-        )
-        for shape in self.scene.physics_engine.space.bb_query(query_bb, pymunk.ShapeFilter()):
-            sprite = self.scene.physics_engine.get_sprite_for_shape(shape)
-            if not isinstance(sprite, Plant):
-                continue
-            dx = sprite.center_x - seed_x
-            dy = sprite.center_y - seed_y
-            if dx * dx + dy * dy < min_spacing_sq:
-                return False
 
         self.add_plant(seed_x, seed_y, growth_level=growth_level)
         return True
 
+    def handle_seed_drops(self, seeds: np.ndarray) -> np.ndarray:
+        """
+        Plant a batch of seeds given as an (n, 2) array of positions.
+
+        Bounds are checked for the whole batch at once; the spacing check then runs
+        seed by seed in order, so an earlier seed wins over a later one landing too
+        close to it. Returns a boolean array marking the seeds that took root.
+        """
+        min_x, max_x, min_y, max_y = self._seed_bounds
+        seed_x = seeds[:, 0]
+        seed_y = seeds[:, 1]
+        planted = (min_x <= seed_x) & (seed_x <= max_x) & (min_y <= seed_y) & (seed_y <= max_y)
+        is_clear = self.plant_system.is_clear
+        with self.batch_spawn():
+            for i, (x, y) in zip(np.flatnonzero(planted).tolist(), seeds[planted].tolist()):
+                if is_clear(x, y):
+                    self.add_plant(x, y)
+                else:
+                    planted[i] = False
+        return planted
+
+    @contextmanager
+    def batch_spawn(self):
+        """
+        Defer adding new plants and herbivores to their sprite lists until the block
+        ends, then append each layer's newcomers with a single extend().
+
+        Physics and system registration still happen immediately, so spacing checks
+        inside the block see plants spawned earlier in it. Nested blocks join the
+        outermost one.
+        """
+        if self._pending_sprites is not None:
+            yield
+            return
+        self._pending_sprites = {"plants": [], "herbivores": []}
+        try:
+            yield
+        finally:
+            pending, self._pending_sprites = self._pending_sprites, None
+            for layer_name, sprites in pending.items():
+                if sprites:
+                    self.scene[layer_name].extend(sprites)
+
+    def _add_to_layer(self, layer_name: str, sprite: arcade.Sprite):
+        if self._pending_sprites is not None:
+            self._pending_sprites[layer_name].append(sprite)
+        else:
+            self.scene.add_sprite(layer_name, sprite)
+
     def add_entity(self, entity, layer_name: str):
         """Add an entity to a specific layer"""
         self.scene.add_sprite(layer_name, entity)
@@ -65,34 +170,78 @@ class EntityManager():
         if hasattr(entity, 'use_physics') and entity.use_physics:
             self.scene.physics_engine.add_sprite(entity)
 
-    def add_plant(self, x: float | None = None, y: float | None = None, *args, **kwargs):
-        plant_x = x if x is not None else self.map_size[0] / 2
-        plant_y = y if y is not None else self.map_size[1] / 2
-        plant = Plant(plant_x, plant_y, entity_manager=self, *args, **kwargs)
-        self.scene.add_sprite("plants", plant)
+    def add_plant(self, x: float | None = None, y: float | None = None, growth_level: int = 1):
+        center_x, center_y = self.map_center
+        plant_x = x if x is not None else center_x
+        plant_y = y if y is not None else center_y
+        plant = Plant(plant_x, plant_y, entity_manager=self, growth_level=growth_level)
+        self._add_to_layer("plants", plant)
+        self._register_plant(plant, growth_level)
+
+    def add_plants(self, positions, growth_levels):
+        """Add many plants at once, e.g. for the initial population."""
+        with self.batch_spawn():
+            for (x, y), growth_level in zip(positions, growth_levels):
+                self.add_plant(x, y, growth_level=growth_level)
+
+    def _register_plant(self, plant: Plant, growth_level: int):
         self.scene.physics_engine.add_sprite(
             plant,
             collision_type="plant",
             body_type=arcade.PymunkPhysicsEngine.STATIC
         )
+        plant._idx = self.plant_system.add(plant, growth_level)
+
+    def remove_plant(self, plant: Plant):
+        """Remove a plant from the scene, the physics engine and the plant system"""
+        self.plant_system.remove(plant)
+        # Also detaches the sprite from every physics engine it was added to
+        plant.remove_from_sprite_lists()
 
     def add_herbivore(self, x: float | None = None, y: float | None = None, *args, **kwargs):
-        herbivore_x = x if x is not None else self.map_size[0] / 2
-        herbivore_y = y if y is not None else self.map_size[1] / 2
+        center_x, center_y = self.map_center
+        herbivore_x = x if x is not None else center_x
+        herbivore_y = y if y is not None else center_y
         herbivore = Herbivore(herbivore_x, herbivore_y, entity_manager=self, *args, **kwargs)
-        self.scene.add_sprite("herbivores", herbivore)
+        self._add_to_layer("herbivores", herbivore)
         self.scene.physics_engine.add_sprite(herbivore)
+        herbivore._idx = self.herbivore_system.add(herbivore)
+
+    def remove_herbivore(self, herbivore: Herbivore):
+        """Remove a herbivore from the scene, the physics engine and the herbivore system"""
+        self.herbivore_system.remove(herbivore)
+        herbivore.remove_from_sprite_lists()
 
     def update(self, delta_time: float = 1/60):
         """Update all entities and physics"""
-        self.scene.update(delta_time)
+        # Plants and herbivores are advanced in batches rather than per sprite
+        self.plant_system.tick(delta_time)
+        self.herbivore_system.update(delta_time)
         self.scene.physics_engine.step()
 
+    def draw(self, view: tuple[float, float, float, float]):
+        """Draw the scene, skipping tile chunks outside the (left, right, bottom, top) view."""
+        if view != self._culled_view:
+            # The camera moved; redo the culling. Idle frames reuse the last result.
+            left, right, bottom, top = view
+            self._visible_chunks = [
+                chunk
+                for chunks in self._tile_chunks.values()
+                for (chunk_left, chunk_right, chunk_bottom, chunk_top), chunk in chunks
+                if chunk_left < right and chunk_right > left and chunk_bottom < top and chunk_top > bottom
+            ]
+            self._culled_view = view
+        for chunk in self._visible_chunks:
+            chunk.draw()
+        for sprite_list in self._entity_layers:
+            sprite_list.draw()
+
     def get_map_size(self):
-        return self.tile_map.width * self.tile_map.tile_width, self.tile_map.height * self.tile_map.tile_height
+        return self.map_size
     
     def spawn_initial_population(self):
-        Plant.spawn_initial(self)
-        self.add_herbivore()
+        with self.batch_spawn():
+            Plant.spawn_initial(self)
+            self.add_herbivore()
 
-        
\ No newline at end of file
+        
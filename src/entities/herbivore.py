@@ -2,10 +2,19 @@ from .entity import Entity
 from sprite_manager import sprite_manager
 
 class Herbivore(Entity):
+    __slots__ = ("_idx",)
+
+    TEXTURE = None
+
+    @classmethod
+    def load_texture(cls):
+        return cls.lazy_texture("TEXTURE", lambda: sprite_manager.get_texture("herbivore"))
+
     def __init__(self, x, y, entity_manager):
-        texture = sprite_manager.get_texture("herbivore")
-        super().__init__(texture, x, y)
+        super().__init__(Herbivore.load_texture(), x, y)
         self.entity_manager = entity_manager
+        # Row in the HerbivoreSystem arrays; assigned once physics owns the body
+        self._idx = -1
 
-    def update(self, delta_time: float = 1/60):
-        pass
+    def despawn(self):
+        self.entity_manager.remove_herbivore(self)
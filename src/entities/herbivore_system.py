@@ -0,0 +1,116 @@
+import math
+import numpy as np
+from config import WALKING_CREATURE_CONFIG
+from random_pool import uniform_pool
+from sprite_config import SPRITE_ANGLE_OFFSET
+
+HERBIVORE_CAPACITY = 64
+TAU = 2 * math.pi
+
+# Headings are quantised to DIRECTIONS evenly spaced angles, indexed by a uint8,
+# so turning is a table lookup instead of trig
+DIRECTIONS = 256
+_DIR_ANGLES = np.linspace(0, TAU, DIRECTIONS, endpoint=False)
+DIR_COS = np.cos(_DIR_ANGLES).astype(np.float32)
+DIR_SIN = np.sin(_DIR_ANGLES).astype(np.float32)
+DIR_BODY_ANGLE = (_DIR_ANGLES + SPRITE_ANGLE_OFFSET).astype(np.float32)
+
+
+class HerbivoreSoA:
+    """
+    Per-herbivore movement state stored as parallel arrays.
+    Row i belongs to the herbivore whose _idx is i; rows 0..count-1 are live.
+    vx, vy and body_angle are looked up from direction and only change when it does.
+    """
+    def __init__(self, capacity: int = HERBIVORE_CAPACITY):
+        self.count = 0
+        self.direction = np.zeros(capacity, dtype=np.uint8)
+        self.turn_timer = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.body_angle = np.zeros(capacity, dtype=np.float32)
+
+    def reserve(self) -> int:
+        row = self.count
+        if row == len(self.direction):
+            for name in ("direction", "turn_timer", "vx", "vy", "body_angle"):
+                old = getattr(self, name)
+                grown = np.zeros(2 * row, dtype=old.dtype)
+                grown[:row] = old
+                setattr(self, name, grown)
+        self.count = row + 1
+        return row
+
+    def move_row(self, src: int, dst: int) -> None:
+        for array in (self.direction, self.turn_timer, self.vx, self.vy, self.body_angle):
+            array[dst] = array[src]
+
+
+class HerbivoreSystem:
+    """
+    Advances every herbivore's wandering in one vectorised pass per frame and
+    pushes the resulting velocities to their pymunk bodies.
+    """
+    SPEED = WALKING_CREATURE_CONFIG["herbivore"].base_speed
+    TURN_INTERVAL = WALKING_CREATURE_CONFIG["herbivore"].turn_interval
+    DIR_VX = DIR_COS * SPEED
+    DIR_VY = DIR_SIN * SPEED
+
+    def __init__(self, physics_engine):
+        self.physics_engine = physics_engine
+        self.soa = HerbivoreSoA()
+        self.herbivores = []
+        self.bodies = []
+        self.rng = np.random.default_rng()
+
+    def add(self, herbivore) -> int:
+        """Register a herbivore already added to the physics engine and return its row."""
+        soa = self.soa
+        row = soa.reserve()
+        soa.turn_timer[row] = uniform_pool.uniform(0, self.TURN_INTERVAL)
+        self._set_heading(row, int(uniform_pool.uniform(0, DIRECTIONS)))
+        self.herbivores.append(herbivore)
+        self.bodies.append(self.physics_engine.get_physics_object(herbivore).body)
+        return row
+
+    def remove(self, herbivore) -> None:
+        """Drop a herbivore's row, moving the last row into its place."""
+        soa = self.soa
+        row = herbivore._idx
+        if row < 0:
+            return
+        herbivore._idx = -1
+        last = soa.count - 1
+        moved = self.herbivores.pop()
+        body = self.bodies.pop()
+        if row != last:
+            soa.move_row(last, row)
+            self.herbivores[row] = moved
+            self.bodies[row] = body
+            moved._idx = row
+        soa.count = last
+
+    def _set_heading(self, rows, directions):
+        """Store new direction indices and the velocities and body angles they map to."""
+        soa = self.soa
+        soa.direction[rows] = directions
+        soa.vx[rows] = self.DIR_VX[directions]
+        soa.vy[rows] = self.DIR_VY[directions]
+        soa.body_angle[rows] = DIR_BODY_ANGLE[directions]
+
+    def update(self, delta_time: float) -> None:
+        soa = self.soa
+        n = soa.count
+        if n == 0:
+            return
+
+        turn_timer = soa.turn_timer[:n]
+        turn_timer -= delta_time
+        turning = np.flatnonzero(turn_timer <= 0)
+        if turning.size:
+            self._set_heading(turning, self.rng.integers(0, DIRECTIONS, turning.size, dtype=np.uint8))
+            turn_timer[turning] = self.TURN_INTERVAL
+
+        for body, x, y, a in zip(self.bodies, soa.vx[:n].tolist(), soa.vy[:n].tolist(), soa.body_angle[:n].tolist()):
+            body.velocity = (x, y)
+            body.angle = a
@@ -0,0 +1,194 @@
+import math
+import numpy as np
+from config import PLANT_CONFIG, PLANT_MAX_GROWTH_LEVEL, PLANT_MIN_SPACING, PLANT_MIN_SPACING_SQ
+from entities.plant import Plant
+from random_pool import uniform_pool
+
+PLANT_ARRAY_CAPACITY = 256
+TAU = 2 * math.pi
+TIMER_VARIABILITY = 0.2
+
+
+class PlantSystem:
+    """
+    Owns every plant's position, growth and reproduction state as parallel arrays.
+    Row i belongs to the plant whose _idx is i; rows 0..count-1 are live and
+    tick() advances all of them with masked array operations.
+    """
+    # Config values bound once, since they are read on every tick
+    MAX_GROWTH_TIMER = PLANT_CONFIG.max_growth_timer
+    REPRODUCTION_DELAY = PLANT_CONFIG.reproduction_delay
+    REPRODUCTION_FACTOR = PLANT_CONFIG.reproduction.factor
+    MAX_SUCCESSES = PLANT_CONFIG.reproduction.max_successes
+    MAX_FAILS = PLANT_CONFIG.reproduction.max_fails
+    SEED_MIN_DISTANCE = PLANT_CONFIG.seed_min_distance
+    SEED_RANGE = PLANT_CONFIG.seed_range
+
+    def __init__(self, entity_manager, capacity: int = PLANT_ARRAY_CAPACITY):
+        self.entity_manager = entity_manager
+        self.count = 0
+        self.xy = np.zeros((capacity, 2), dtype=np.float32)
+        # A plant is either growing or reproducing, so one timer serves both phases
+        self.timer = np.zeros(capacity, dtype=np.float32)
+        self.level = np.zeros(capacity, dtype=np.int8)
+        self.full = np.zeros(capacity, dtype=np.bool_)
+        self.factor = np.zeros(capacity, dtype=np.float32)
+        self.successes = np.zeros(capacity, dtype=np.int16)
+        self.fails = np.zeros(capacity, dtype=np.int16)
+        self.plants: list[Plant] = []
+        # Uniform grid of row indices, cell size == min spacing so a
+        # spacing check only ever needs the 3x3 neighbourhood of a cell.
+        self.grid: dict[tuple[int, int], list[int]] = {}
+        self.cell = PLANT_MIN_SPACING
+        self.rng = np.random.default_rng()
+
+    def cell_key(self, x: float, y: float) -> tuple[int, int]:
+        cell = self.cell
+        return int(x // cell), int(y // cell)
+
+    def is_clear(self, x: float, y: float) -> bool:
+        """True when no plant lies within the minimum spacing of (x, y)."""
+        grid = self.grid
+        gx, gy = self.cell_key(x, y)
+        rows = []
+        for cx in (gx - 1, gx, gx + 1):
+            for cy in (gy - 1, gy, gy + 1):
+                cell = grid.get((cx, cy))
+                if cell:
+                    rows.extend(cell)
+        if not rows:
+            return True
+        diff = self.xy[rows] - (x, y)
+        return not (np.einsum("ij,ij->i", diff, diff) < PLANT_MIN_SPACING_SQ).any()
+
+    def _grow_arrays(self):
+        size = 2 * len(self.level)
+        for name in ("xy", "timer", "level", "full", "factor", "successes", "fails"):
+            old = getattr(self, name)
+            grown = np.zeros((size,) + old.shape[1:], dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    def add(self, plant: Plant, growth_level: int) -> int:
+        """Give a plant a row with fresh timers and return the row index."""
+        row = self.count
+        if row == len(self.level):
+            self._grow_arrays()
+        self.xy[row] = plant.center_x, plant.center_y
+        full = growth_level >= PLANT_MAX_GROWTH_LEVEL
+        self.timer[row] = self.REPRODUCTION_DELAY if full else self.MAX_GROWTH_TIMER
+        self.level[row] = growth_level
+        self.full[row] = full
+        self.factor[row] = 1
+        self.successes[row] = 0
+        self.fails[row] = 0
+        self.count = row + 1
+        self.plants.append(plant)
+        self.grid.setdefault(self.cell_key(plant.center_x, plant.center_y), []).append(row)
+        return row
+
+    def remove(self, plant: Plant):
+        row = plant._idx
+        if row < 0:
+            return
+        plant._idx = -1
+        grid = self.grid
+        # Cell keys come from the sprite centers (plants are static), never from
+        # the float32 rows, so a plant always maps back to the cell it was filed in.
+        grid[self.cell_key(plant.center_x, plant.center_y)].remove(row)
+        # Swap-remove: move the last row into the freed one so rows stay contiguous
+        last = self.count - 1
+        moved = self.plants.pop()
+        if row != last:
+            moved_cell = grid[self.cell_key(moved.center_x, moved.center_y)]
+            moved_cell[moved_cell.index(last)] = row
+            for array in (self.xy, self.timer, self.level, self.full,
+                          self.factor, self.successes, self.fails):
+                array[row] = array[last]
+            self.plants[row] = moved
+            moved._idx = row
+        self.count = last
+
+    def tick(self, delta_time: float = 1/60):
+        n = self.count
+        if n == 0:
+            return
+
+        # Growth and reproduction share one timer column, so a single
+        # unmasked subtraction advances every plant
+        timer = self.timer[:n]
+        timer -= delta_time
+        due = np.flatnonzero(timer <= 0)
+        if not due.size:
+            return
+
+        due_full = self.full[due]
+        grown = due[~due_full]
+        if grown.size:
+            level = self.level
+            level[grown] += 1
+            new_levels = level[grown]
+            matured = new_levels >= PLANT_MAX_GROWTH_LEVEL
+            self.full[grown] = matured
+            # Plants that mature this tick start their first reproduction delay
+            timer[grown] = np.where(
+                matured,
+                self.REPRODUCTION_DELAY,
+                self.MAX_GROWTH_TIMER * self.rng.uniform(1 - TIMER_VARIABILITY, 1 + TIMER_VARIABILITY, grown.size),
+            )
+            textures = Plant.GROWTH_TEXTURES
+            plants = self.plants
+            for row, new_level in zip(grown.tolist(), new_levels.tolist()):
+                plants[row].texture = textures[new_level - 1]
+
+        ready = due[due_full]
+        if ready.size:
+            self._reproduce(ready)
+
+    def _reproduce(self, ready: np.ndarray):
+        dropped = self.entity_manager.handle_seed_drops(self.seed_positions(ready))
+        # Seeds that took root may have grown the arrays, so read them only now
+        successes = self.successes
+        fails = self.fails
+        factor = self.factor
+
+        took = ready[dropped]
+        successes[took] += 1
+        fails[took] = 0
+        missed = ready[~dropped]
+        fails[missed] += 1
+        successes[missed] = 0
+
+        reset = ready[successes[ready] >= self.MAX_SUCCESSES]
+        successes[reset] = 0
+        factor[reset] = 1
+        backoff = ready[fails[ready] >= self.MAX_FAILS]
+        fails[backoff] = 0
+        factor[backoff] *= self.REPRODUCTION_FACTOR
+
+        # Reset timers with randomization
+        self.timer[ready] = self.REPRODUCTION_DELAY * factor[ready] * self.rng.uniform(
+            1 - TIMER_VARIABILITY, 1 + TIMER_VARIABILITY, ready.size
+        )
+
+    def seed_positions(self, rows: np.ndarray) -> np.ndarray:
+        """Pick where each of the given plants drops its seed, as an (n, 2) array."""
+        rng = self.rng
+        direction = rng.uniform(0, TAU, rows.size)
+        distance = rng.uniform(self.SEED_MIN_DISTANCE, self.SEED_RANGE, rows.size)
+        offsets = np.column_stack((np.cos(direction), np.sin(direction)))
+        offsets *= distance[:, None]
+        return self.xy[rows] + offsets
+
+    def set_level(self, row: int, growth_level: int):
+        """Jump a plant to a growth level and restart the timer of its new phase."""
+        was_full = self.full[row]
+        full = growth_level >= PLANT_MAX_GROWTH_LEVEL
+        self.level[row] = growth_level
+        self.full[row] = full
+        if not full:
+            self.timer[row] = self.MAX_GROWTH_TIMER * uniform_pool.uniform(
+                1 - TIMER_VARIABILITY, 1 + TIMER_VARIABILITY
+            )
+        elif not was_full:
+            self.timer[row] = self.REPRODUCTION_DELAY
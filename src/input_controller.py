@@ -1,27 +1,68 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 import arcade
 
+from simulation.camera_controller import KEY_DOWN, KEY_LEFT, KEY_RIGHT, KEY_UP
+
+ZOOM_IN_KEY = arcade.key.X
+ZOOM_OUT_KEY = arcade.key.Z
+
+
+class KeySet:
+    """
+    Set of held key codes backed by a bytearray indexed by key code, so per-frame
+    checks are single byte reads (held[key]) that can be added and subtracted.
+    Codes past the table (pyglet's user keys for unmapped scancodes) go to a plain set.
+    """
+    __slots__ = ("held", "_overflow")
+
+    # Every named arcade key code is below 0x10000
+    SIZE = 0x10000
+
+    def __init__(self):
+        self.held = bytearray(self.SIZE)
+        self._overflow: set[int] = set()
+
+    def add(self, key: int) -> None:
+        if 0 <= key < self.SIZE:
+            self.held[key] = 1
+        else:
+            self._overflow.add(key)
+
+    def discard(self, key: int) -> None:
+        if 0 <= key < self.SIZE:
+            self.held[key] = 0
+        else:
+            self._overflow.discard(key)
+
+    def __contains__(self, key: int) -> bool:
+        if 0 <= key < self.SIZE:
+            return self.held[key] == 1
+        return key in self._overflow
+
 
-@dataclass
 class InputState:
-    pressed_keys: set[int] = field(default_factory=set)
-    mouse_buttons: set[int] = field(default_factory=set)
-    mouse_x: int = 0
-    mouse_y: int = 0
-    modifiers: int = 0
+    __slots__ = ("pressed_keys", "mouse_buttons", "mouse_x", "mouse_y", "modifiers")
 
+    def __init__(self):
+        self.pressed_keys = KeySet()
+        self.mouse_buttons: set[int] = set()
+        self.mouse_x = 0
+        self.mouse_y = 0
+        self.modifiers = 0
 
-@dataclass
+
+@dataclass(slots=True)
 class InputTargets:
     camera: object
     selected_creature: Optional[object] = None
 
 
 class InputMode:
+    __slots__ = ()
     name: str = "base"
 
     def on_enter(self, state: InputState, targets: InputTargets) -> None:
@@ -65,17 +106,18 @@ class InputMode:
 
 
 class CameraMode(InputMode):
+    __slots__ = ()
     name = "camera"
 
     def on_key_press(self, key: int, modifiers: int, state: InputState, targets: InputTargets) -> bool:
         camera = targets.camera
-        if getattr(camera, "camera", None) is None:
+        if not camera.ready:
             return True
 
-        if key == arcade.key.X:
+        if key == ZOOM_IN_KEY:
             camera.apply_zoom("in")
             return True
-        if key == arcade.key.Z:
+        if key == ZOOM_OUT_KEY:
             camera.apply_zoom("out")
             return True
 
@@ -93,7 +135,7 @@ class CameraMode(InputMode):
         targets: InputTargets,
     ) -> bool:
         camera = targets.camera
-        if getattr(camera, "camera", None) is None:
+        if not camera.ready:
             return True
         camera.handle_drag(dx, dy)
         return True
@@ -108,7 +150,7 @@ class CameraMode(InputMode):
         targets: InputTargets,
     ) -> bool:
         camera = targets.camera
-        if getattr(camera, "camera", None) is None:
+        if not camera.ready:
             return True
 
         if scroll_y > 0:
@@ -122,16 +164,27 @@ class CameraMode(InputMode):
 
     def update(self, dt: float, state: InputState, targets: InputTargets) -> None:
         camera = targets.camera
-        if getattr(camera, "camera", None) is None:
+        if not camera.ready:
+            return
+        camera.apply_drag()
+        # Nothing to pan on the (usual) frames where no arrow key is held
+        held = state.pressed_keys.held
+        if not (held[KEY_LEFT] or held[KEY_RIGHT] or held[KEY_UP] or held[KEY_DOWN]):
             return
         camera.update_panning(state.pressed_keys, dt)
 
 
+# Events bubbled through the mode stack by InputController._dispatch
+DISPATCHED_EVENTS = ("on_key_press", "on_key_release", "on_mouse_drag", "on_mouse_scroll")
+
+
 class InputController:
     def __init__(self, targets: InputTargets, default_mode: InputMode):
         self.targets = targets
         self.state = InputState()
         self._mode_stack: list[InputMode] = [default_mode]
+        self._handlers: dict[str, list] = {}
+        self._rebuild_handlers()
         default_mode.on_enter(self.state, self.targets)
 
     @property
@@ -141,6 +194,7 @@ class InputController:
     def push_mode(self, mode: InputMode) -> None:
         self.mode.on_exit(self.state, self.targets)
         self._mode_stack.append(mode)
+        self._rebuild_handlers()
         mode.on_enter(self.state, self.targets)
 
     def pop_mode(self) -> None:
@@ -148,6 +202,7 @@ class InputController:
             return
         self.mode.on_exit(self.state, self.targets)
         self._mode_stack.pop()
+        self._rebuild_handlers()
         self.mode.on_enter(self.state, self.targets)
 
     def on_key_press(self, key: int, modifiers: int) -> None:
@@ -180,10 +235,18 @@ class InputController:
     def update(self, dt: float) -> None:
         self.mode.update(dt, self.state, self.targets)
 
+    def _rebuild_handlers(self) -> None:
+        # Bound handlers per event, top-most mode first; only changes with the mode stack.
+        modes = self._mode_stack[::-1]
+        self._handlers = {
+            method_name: [getattr(mode, method_name) for mode in modes]
+            for method_name in DISPATCHED_EVENTS
+        }
+
     def _dispatch(self, method_name: str, *args) -> None:
         # Bubble from top-most mode down until consumed.
-        for mode in reversed(self._mode_stack):
-            handler = getattr(mode, method_name)
-            consumed = handler(*args, self.state, self.targets)
-            if consumed:
+        state = self.state
+        targets = self.targets
+        for handler in self._handlers[method_name]:
+            if handler(*args, state, targets):
                 return
@@ -2,6 +2,7 @@ import pygame
 import numpy as np
 import random
 import math
+from collections import OrderedDict
 from pettingzoo import ParallelEnv
 from gymnasium.spaces import Box, Discrete, Dict
 
@@ -20,6 +21,38 @@ PAN_SPEED = 6000  # pixels per second
 # Add a new variable to control FOV visibility near the top of the file after the ZOOM_SPEED definition
 SHOW_FOV = True  # Can be toggled with F key
 PERFORMANCE_MODE = False  # Can be toggled with P key
+# FOV cones and energy bars are too small to read when zoomed out past these
+FOV_MIN_ZOOM = 0.5
+BAR_MIN_ZOOM = 0.5
+HIDE_ZOOMED_OUT_DETAILS = True  # Can be toggled with D key
+# Most rendered HUD strings kept by CreatureSimulation._text
+TEXT_CACHE_SIZE = 256
+
+# Shared numpy random generator for batched draws
+RNG = np.random.default_rng()
+RANDOM_POOL_SIZE = 4096
+
+
+class UniformPool:
+    """
+    Hands out uniform floats one at a time from a buffer refilled in bulk from RNG,
+    so scalar draws on per-frame paths cost a list index instead of an RNG call
+    """
+    def __init__(self, size=RANDOM_POOL_SIZE):
+        self.size = size
+        self.values = []
+        self.index = size
+
+    def uniform(self, low=0.0, high=1.0):
+        if self.index >= self.size:
+            self.values = RNG.random(self.size).tolist()
+            self.index = 0
+        u = self.values[self.index]
+        self.index += 1
+        return low + (high - low) * u
+
+
+random_pool = UniformPool()
 
 class Camera:
     """A camera that allows zooming and panning of the simulation world"""
@@ -32,6 +65,18 @@ class Camera:
         self.dragging = False
         self.drag_start = None
         self.drag_last_pos = None
+        self.begin_frame()
+
+    def begin_frame(self):
+        """
+        Cache the world-to-screen offset for the current position and zoom.
+        Called once per frame after input handling, before anything is drawn.
+        """
+        self.offset_x = self.position[0] - self.screen_width / (2 * self.zoom)
+        self.offset_y = self.position[1] - self.screen_height / (2 * self.zoom)
+        self.offset = np.array((self.offset_x, self.offset_y))
+        # Sprites only need scaling when zoomed in or out
+        self.scaled = self.zoom != 1.0
         
     def zoom_at_point(self, amount, screen_pos=None):
         """Zoom centered on a specific screen position"""
@@ -132,16 +177,15 @@ class Camera:
         self.position[1] = max(min_y, min(max_y, self.position[1]))
     
     def world_to_screen(self, world_pos):
-        """Convert world coordinates to screen coordinates"""
-        # Calculate offset from camera position to center of screen
-        offset_x = self.position[0] - self.screen_width / (2 * self.zoom)
-        offset_y = self.position[1] - self.screen_height / (2 * self.zoom)
-        
-        # Convert world position to screen position
-        screen_x = (world_pos[0] - offset_x) * self.zoom
-        screen_y = (world_pos[1] - offset_y) * self.zoom
+        """Convert world coordinates to screen coordinates, using the offset cached by begin_frame()"""
+        screen_x = (world_pos[0] - self.offset_x) * self.zoom
+        screen_y = (world_pos[1] - self.offset_y) * self.zoom
         
         return (int(screen_x), int(screen_y))
+
+    def world_to_screen_batch(self, world_positions):
+        """Convert an (n, 2) array of world coordinates to (unrounded) screen coordinates"""
+        return (world_positions - self.offset) * self.zoom
     
     def screen_to_world(self, screen_pos):
         """Convert screen coordinates to world coordinates"""
@@ -162,9 +206,16 @@ SPAWN_AREA = {
     "y_min": SPAWN_PADDING,
     "y_max": WORLD_SIZE[1] - SPAWN_PADDING
 }
+# Spawn area bounds as plain floats, read on every frame
+X_MIN, X_MAX = SPAWN_AREA["x_min"], SPAWN_AREA["x_max"]
+Y_MIN, Y_MAX = SPAWN_AREA["y_min"], SPAWN_AREA["y_max"]
+# Corners of the spawn area, for clipping whole position arrays
+SPAWN_AREA_MIN = (X_MIN, Y_MIN)
+SPAWN_AREA_MAX = (X_MAX, Y_MAX)
 
 # Load the sprite sheet
-SPRITE_SHEET = pygame.image.load('assets/images/sprites2.png')
+SPRITE_SHEET_PATH = 'assets/images/sprites2.png'
+SPRITE_SHEET = pygame.image.load(SPRITE_SHEET_PATH)
 # Constants for sprite dimensions
 SPRITE_SIZE = 40
 GRID_SIZE = 3
@@ -173,7 +224,11 @@ GRID_SIZE = 3
 def get_sprite(i):
     x = i % GRID_SIZE
     y = i // GRID_SIZE
-    return SPRITE_SHEET.subsurface((x * SPRITE_SIZE, y * SPRITE_SIZE, SPRITE_SIZE, SPRITE_SIZE))
+    sprite = SPRITE_SHEET.subsurface((x * SPRITE_SIZE, y * SPRITE_SIZE, SPRITE_SIZE, SPRITE_SIZE))
+    if pygame.display.get_surface() is not None:
+        # Standalone copy in the display's pixel format, so blits need no conversion
+        sprite = sprite.convert_alpha()
+    return sprite
 
 PLANT_CONFIG = {
     "initial_plants": 150,
@@ -227,6 +282,12 @@ MAMMAL_CONFIG = {
     "bar_background_color": (100, 100, 100),
 }
 
+# Energy bar settings, read on every frame
+BAR_WIDTH = MAMMAL_CONFIG["bar_width"]
+BAR_HEIGHT = MAMMAL_CONFIG["bar_height"]
+BAR_PADDING = MAMMAL_CONFIG["bar_padding"]
+BAR_BACKGROUND_COLOR = MAMMAL_CONFIG["bar_background_color"]
+
 HERBIVORE_CONFIG = {
     # default
     "initial_amount": 20,
@@ -285,88 +346,191 @@ CARNIVORE_CONFIG = {
 SMARTIE_SPRITE = get_sprite(2)
 
 
+def _bar_color(energy_percent):
+    if energy_percent > 0.9:
+        return (0, 255, 0)  # Green
+    if energy_percent > 0.7:
+        return (255, 255, 0)  # Yellow
+    if energy_percent > 0.2:
+        return (255, 128, 0)  # Orange
+    return (255, 0, 0)  # Red
+
+
+# Energy bar color for every energy fraction, indexed by int(fraction * 255)
+BAR_COLORS = tuple(_bar_color(i / 255) for i in range(256))
+
+
+def init_sprites():
+    """
+    Reload the sprite tables in the display's pixel format.
+    Must be called after pygame.display.set_mode().
+    """
+    global SPRITE_SHEET, SMARTIE_SPRITE
+    SPRITE_SHEET = pygame.image.load(SPRITE_SHEET_PATH).convert_alpha()
+    PLANT_CONFIG["sprites"] = [get_sprite(3+i) for i in range(4)]
+    MAMMAL_CONFIG["sprite"] = get_sprite(0)
+    HERBIVORE_CONFIG["sprite"] = get_sprite(0)
+    CARNIVORE_CONFIG["sprite"] = get_sprite(1)
+    SMARTIE_SPRITE = get_sprite(2)
+
+
+# Cosine and sine of every heading in tenths of a degree, indexed by int(angle * 10) % 3600
+TRIG_STEPS = 3600
+_TRIG_ANGLES = np.radians(np.arange(TRIG_STEPS) * (360 / TRIG_STEPS))
+COS = np.cos(_TRIG_ANGLES)
+SIN = np.sin(_TRIG_ANGLES)
+
+
+def heading_index(angle):
+    """Index into COS/SIN for angles in degrees (a scalar or an array)"""
+    return (np.asarray(angle) * (TRIG_STEPS / 360)).astype(np.int64) % TRIG_STEPS
+
+
+# Mammal sprites are pre-rotated in steps of this many degrees
+ROTATION_STEP = 2
+_ROTATED_SPRITES = {}
+
+
+def get_rotated_sprites(sprite, alpha=255):
+    """Return the table of rotations of sprite (one per ROTATION_STEP), building it on first use"""
+    key = (sprite, alpha)
+    rotations = _ROTATED_SPRITES.get(key)
+    if rotations is None:
+        rotations = []
+        for angle in range(0, 360, ROTATION_STEP):
+            rotated = pygame.transform.rotate(sprite, -(angle + 90))
+            rotated.set_alpha(alpha)
+            rotations.append(rotated)
+        _ROTATED_SPRITES[key] = rotations
+    return rotations
+
+
+# Unit-length FOV cone outlines for every whole-degree heading, keyed by view angle
+_FOV_SHAPES = {}
+
+
+def get_fov_shape(view_angle):
+    """
+    Return (arcs, edges) for a cone view_angle degrees wide: arcs[h] holds the
+    unit offsets of the points along its arc and edges[h] those of its two
+    edges when facing h degrees
+    """
+    shape = _FOV_SHAPES.get(view_angle)
+    if shape is None:
+        half_angle = view_angle / 2
+        # Use fewer points for wider FOVs for better performance
+        step_size = max(5, min(10, int(view_angle / 15)))
+        steps = max(5, int(view_angle / step_size))
+        headings = np.arange(360)[:, None]
+        arc = np.radians(headings - half_angle + np.arange(steps + 1) * step_size)
+        edge = np.radians(headings + (-half_angle, half_angle))
+        shape = (
+            np.stack((np.cos(arc), np.sin(arc)), axis=-1),
+            np.stack((np.cos(edge), np.sin(edge)), axis=-1),
+        )
+        _FOV_SHAPES[view_angle] = shape
+    return shape
+
+
+# Pixel offsets covered by a pygame.draw.circle dot, keyed by radius
+_DOT_OFFSETS = {}
+
+
+def get_dot_offsets(radius):
+    """Return the (dx, dy) pixel offsets pygame.draw.circle fills for a dot of this radius"""
+    offsets = _DOT_OFFSETS.get(radius)
+    if offsets is None:
+        side = 2 * radius + 3
+        stamp = pygame.Surface((side, side))
+        pygame.draw.circle(stamp, (255, 255, 255), (radius + 1, radius + 1), radius)
+        offsets = np.argwhere(pygame.surfarray.array_red(stamp) > 0) - (radius + 1)
+        _DOT_OFFSETS[radius] = offsets
+    return offsets
+
+
+# LRU cache of scaled sprites shared by all beings, keyed by (source sprite, zoom bucket)
+SCALED_CACHE_SIZE = 4096
+_SCALED_SPRITES = OrderedDict()
+
+
+def get_scaled_sprite(sprite, zoom):
+    """Return sprite scaled by zoom, cached at common zoom levels"""
+    zoom_key = round(zoom, 1)  # Round to nearest 0.1
+    key = (sprite, zoom_key)
+    scaled = _SCALED_SPRITES.get(key)
+    if scaled is not None:
+        _SCALED_SPRITES.move_to_end(key)
+        return scaled
+    current_width, current_height = sprite.get_size()
+    new_width = int(current_width * zoom)
+    new_height = int(current_height * zoom)
+    if new_width <= 0 or new_height <= 0:  # Ensure valid size
+        return sprite
+    scaled = _SCALED_SPRITES[key] = pygame.transform.scale(sprite, (new_width, new_height))
+    if len(_SCALED_SPRITES) > SCALED_CACHE_SIZE:
+        _SCALED_SPRITES.popitem(last=False)  # Evict the least recently used
+    return scaled
+
+
 class Being:
+    # Whether the sprite is drawn turned to the being's angle
+    rotates = False
+
     def __init__(self, screen, pos=None):
         self.screen = screen
         self.pos = self.spawn_location() if pos is None else pos
 
-    def render(self, camera):
-        # Convert world position to screen position
-        screen_pos = camera.world_to_screen(self.pos)
+    def render(self, camera, screen_pos=None):
+        # Convert world position to screen position, unless the caller already has
+        if screen_pos is None:
+            screen_pos = camera.world_to_screen(self.pos)
         
         # Skip rendering if entity is completely off-screen
         if (screen_pos[0] < -50 or screen_pos[0] > camera.screen_width + 50 or
             screen_pos[1] < -50 or screen_pos[1] > camera.screen_height + 50):
             return
             
-        if hasattr(self, 'angle'):
-            # Optimize sprite rotation through caching
-            # Only rotate when angle changes significantly
-            if not hasattr(self, '_last_rendered_angle') or abs(self._last_rendered_angle - self.angle) > 2:
-                self._last_rendered_angle = self.angle
-                self._rotated_sprite = pygame.transform.rotate(self.sprite, -(self.angle + 90))
-            sprite = self._rotated_sprite
+        if self.rotates:
+            # Pick the precomputed rotation closest below the current angle
+            rotations = get_rotated_sprites(self.sprite, self.alpha)
+            sprite = rotations[int(self.angle) // ROTATION_STEP % len(rotations)]
         else:
             sprite = self.sprite
 
-        # Scale the sprite based on zoom level
-        if camera.zoom != 1.0:
-            current_width, current_height = sprite.get_size()
-            new_width = int(current_width * camera.zoom)
-            new_height = int(current_height * camera.zoom)
-            if new_width > 0 and new_height > 0:  # Ensure valid size
-                # Cache scaled sprites at common zoom levels
-                zoom_key = round(camera.zoom, 1)  # Round to nearest 0.1
-                if not hasattr(self, '_scaled_sprites'):
-                    self._scaled_sprites = {}
-                if zoom_key not in self._scaled_sprites:
-                    self._scaled_sprites[zoom_key] = pygame.transform.scale(sprite, (new_width, new_height))
-                sprite = self._scaled_sprites[zoom_key]
-        
-        sprite_rect = sprite.get_rect(center=screen_pos)
-        self.screen.blit(sprite, sprite_rect.topleft)
+        # Scale the sprite based on zoom level; at zoom 1 it is blitted as is
+        if camera.scaled:
+            sprite = get_scaled_sprite(sprite, camera.zoom)
+        
+        # Blit centered on the screen position
+        self.screen.blit(sprite, (screen_pos[0] - sprite.get_width() // 2,
+                                  screen_pos[1] - sprite.get_height() // 2))
+
+    def despawn(self):
+        """Called once the being has been removed from the simulation"""
+        pass
 
     def spawn_location(self):
         return [
-            random.uniform(SPAWN_AREA["x_min"], SPAWN_AREA["x_max"]), 
-            random.uniform(SPAWN_AREA["y_min"], SPAWN_AREA["y_max"])
+            random_pool.uniform(X_MIN, X_MAX), 
+            random_pool.uniform(Y_MIN, Y_MAX)
         ]
 
 
 class Plant(Being):
+    # Plants may not spawn closer than this to each other
+    MIN_DISTANCE = .9 * PLANT_CONFIG["size"][-1]
+    MIN_DISTANCE_SQUARED = MIN_DISTANCE * MIN_DISTANCE
+
     @classmethod
-    def create(cls, screen, plants_positions_list, growth_stage=None):
+    def create(cls, screen, grid, growth_stage=None):
         """Factory method to create a plant only if a valid position can be found."""
-        # First find a valid position
-        full_growth_size = PLANT_CONFIG["size"][-1]
-        min_distance = .9 * full_growth_size
-        min_distance_squared = min_distance * min_distance
-        
         valid_pos = None
-        # Attempt placing the plant in an empty spot
-        for _ in range(PLANT_CONFIG["spawn_attempts"]):
-            pos = [
-                random.uniform(SPAWN_AREA["x_min"], SPAWN_AREA["x_max"]),
-                random.uniform(SPAWN_AREA["y_min"], SPAWN_AREA["y_max"])
-            ]
-            
-            # First filter plants that are too far to matter
-            nearby_plants = [
-                p for p in plants_positions_list 
-                if abs(p[0] - pos[0]) < min_distance and abs(p[1] - pos[1]) < min_distance
-            ]
-            
-            # Check direct distances for nearby plants using squared distance
-            valid = True
-            for plant in nearby_plants:
-                dx = pos[0] - plant[0]
-                dy = pos[1] - plant[1]
-                squared_dist = dx*dx + dy*dy
-                if squared_dist < min_distance_squared:
-                    valid = False
-                    break
-            
-            if valid:
+        # Draw every candidate spot in one call, then take the first empty one
+        candidates = RNG.uniform(
+            SPAWN_AREA_MIN, SPAWN_AREA_MAX, size=(PLANT_CONFIG["spawn_attempts"], 2)
+        ).tolist()
+        for pos in candidates:
+            if grid.is_clear(pos):
                 valid_pos = pos
                 break
         
@@ -374,14 +538,19 @@ class Plant(Being):
         if valid_pos is None:
             return None
             
-        return cls(screen, valid_pos, growth_stage)
+        plant = cls(screen, valid_pos, growth_stage, grid)
+        grid.add(plant.pos)
+        return plant
 
-    def __init__(self, screen, pos, growth_stage=None):
+    def __init__(self, screen, pos, growth_stage=None, grid=None):
+        # PlantGrid this plant is filed in, if any
+        self.grid = grid
         if growth_stage is None:
             growth_stage = random.randint(0, len(PLANT_CONFIG["size"]) - 1)
         self.growth_stage = growth_stage
         self.sprite = PLANT_CONFIG["sprites"][growth_stage]
         self.size = PLANT_CONFIG["size"][growth_stage]
+        self.radius = self.size / 2
         self.energy_gain = PLANT_CONFIG["energy_gain"][growth_stage]
         self.reset_growth_timer()
         super().__init__(screen, pos)
@@ -398,35 +567,355 @@ class Plant(Being):
         if full_grown:
             return
 
-        # Get delta time (from Mammal class if available, otherwise use default)
-        dt = Mammal.simulation_delta_time if hasattr(Mammal, 'simulation_delta_time') else 0.016
+        # Get delta time shared through the Mammal class
+        dt = Mammal.simulation_delta_time
         
         if self.growth_timer > 0:
             self.growth_timer -= dt
         else:
             self.growth_stage += 1
             self.size = PLANT_CONFIG["size"][self.growth_stage]
+            self.radius = self.size / 2
             self.sprite = PLANT_CONFIG["sprites"][self.growth_stage]
             self.energy_gain = PLANT_CONFIG["energy_gain"][self.growth_stage]
             self.reset_growth_timer()
 
+    def despawn(self):
+        if self.grid is not None:
+            self.grid.remove(self.pos)
+
+
+class PlantGrid:
+    """
+    Spatial hash of plant positions with cell size == Plant.MIN_DISTANCE,
+    so a placement check only needs the 3x3 cells around a candidate.
+    Each simulation owns its own grid.
+    """
+    def __init__(self):
+        self.cells = {}
+
+    def cell_of(self, pos):
+        return int(pos[0] // Plant.MIN_DISTANCE), int(pos[1] // Plant.MIN_DISTANCE)
+
+    def is_clear(self, pos):
+        """Check that no plant lies within Plant.MIN_DISTANCE of pos"""
+        cells = self.cells
+        min_distance_squared = Plant.MIN_DISTANCE_SQUARED
+        cx, cy = self.cell_of(pos)
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for other in cells.get((gx, gy), ()):
+                    dx = pos[0] - other[0]
+                    dy = pos[1] - other[1]
+                    if dx*dx + dy*dy < min_distance_squared:
+                        return False
+        return True
+
+    def add(self, pos):
+        self.cells.setdefault(self.cell_of(pos), []).append(pos)
+
+    def remove(self, pos):
+        self.cells[self.cell_of(pos)].remove(pos)
+
+
+class MammalHerd:
+    """
+    Position, movement and energy state of one species' mammals as parallel arrays.
+    Row i belongs to the mammal whose idx is i; rows 0..count-1 are live and
+    step() moves every living mammal in one vectorized pass.
+    """
+    FIELDS = ("pos", "direction", "angle", "desired_angle", "turn_rate",
+              "speed", "size", "energy", "max_energy", "move_cost", "alive",
+              "reproduction_cooldown", "decay_timer", "target_distance")
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.mammals = []
+        # Longest view distance in the herd, i.e. how far a FOV cone reaches
+        self.view_distance = 0
+        self.pos = np.zeros((capacity, 2))
+        self.direction = np.zeros((capacity, 2))
+        self.angle = np.zeros(capacity)
+        self.desired_angle = np.zeros(capacity)
+        self.turn_rate = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.energy = np.zeros(capacity)
+        self.max_energy = np.ones(capacity)
+        self.move_cost = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.reproduction_cooldown = np.zeros(capacity)
+        self.decay_timer = np.zeros(capacity)
+        self.target_distance = np.zeros(capacity)
+
+    def add(self, mammal):
+        """Reserve a row for a new mammal and return its index"""
+        row = self.count
+        if row == len(self.alive):
+            # Double the capacity, keeping the live rows
+            for name in self.FIELDS:
+                old = getattr(self, name)
+                grown = np.zeros((2 * row,) + old.shape[1:], dtype=old.dtype)
+                grown[:row] = old
+                setattr(self, name, grown)
+        self.mammals.append(mammal)
+        self.count = row + 1
+        return row
+
+    def remove(self, mammal):
+        """Drop a mammal's row, moving the last row into its place"""
+        row = mammal.idx
+        if row < 0:
+            return
+        mammal.idx = -1
+        last = self.count - 1
+        moved = self.mammals.pop()
+        if row != last:
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[row] = array[last]
+            self.mammals[row] = moved
+            moved.idx = row
+        self.count = last
+
+    def step(self, dt):
+        """
+        Advance every mammal's timers, then turn and move every living mammal and
+        charge them for the distance covered
+        """
+        n = self.count
+        if n == 0:
+            return
+        alive = self.alive[:n]
+        # Dead mammals only count down until they despawn
+        self.decay_timer[:n][~alive] -= dt
+        living = np.flatnonzero(alive)
+        if not living.size:
+            return
+
+        cooldown = self.reproduction_cooldown[living]
+        self.reproduction_cooldown[living] = np.where(cooldown > 0, cooldown - dt, cooldown)
+
+        # Gradually turn towards the desired angles, slower at higher speeds
+        speed = self.speed[living]
+        angle = self.angle[living]
+        effective_turn_rate = self.turn_rate[living] * dt / (1 + (speed / 60) ** 2)
+        angle_diff = (self.desired_angle[living] - angle + 180) % 360 - 180
+        # Clamp the step to the remaining difference to prevent overshooting
+        angle += np.sign(angle_diff) * np.minimum(np.abs(angle_diff), effective_turn_rate)
+        angle %= 360
+        heading = heading_index(angle)
+        direction = np.column_stack((COS[heading], SIN[heading]))
+        self.angle[living] = angle
+        self.direction[living] = direction
+
+        # Apply movement based on speed per second and scale by delta time
+        start = self.pos[living]
+        self.pos[living] = start + direction * (speed * dt)[:, None]
+        # Boundary checks using SPAWN_AREA
+        pos = self.pos[:n]
+        np.clip(pos, SPAWN_AREA_MIN, SPAWN_AREA_MAX, out=pos)
+        moved = pos[living] - start
+        self.target_distance[living] += np.hypot(moved[:, 0], moved[:, 1])
+
+        # Scale energy consumption by delta time - move_cost is energy per second
+        energy_cost = self.move_cost[living] * speed * dt
+        self.energy[living] -= np.maximum(energy_cost, 0)
+
+    def render_all(self, screen, camera):
+        """Render the mammals whose sprite or FOV cone may reach the screen"""
+        n = self.count
+        if n == 0:
+            return
+        screen_xy = camera.world_to_screen_batch(self.pos[:n])
+        screen_x = screen_xy[:, 0]
+        screen_y = screen_xy[:, 1]
+        # Same 50 pixel margin as Being.render, widened to fit the FOV cones
+        margin = max(50, self.view_distance * camera.zoom)
+        visible = np.flatnonzero(
+            (screen_x > -margin) & (screen_x < camera.screen_width + margin) &
+            (screen_y > -margin) & (screen_y < camera.screen_height + margin)
+        )
+        # Decide once for the whole herd whether FOV cones and bars are drawn
+        zoom = camera.zoom
+        show_fov = SHOW_FOV and not (HIDE_ZOOMED_OUT_DETAILS and zoom < FOV_MIN_ZOOM)
+        show_bars = not PERFORMANCE_MODE and not (HIDE_ZOOMED_OUT_DETAILS and zoom < BAR_MIN_ZOOM)
+
+        # Energy bars of the living mammals, laid out for the whole herd at once
+        bars = {}
+        if show_bars:
+            living = visible[self.alive[visible]]
+            bars = self.energy_bar_fills(camera, living, screen_x[living], screen_y[living])
+
+        # Whole-pixel positions, truncated like Camera.world_to_screen, handed to
+        # each mammal so it doesn't read its herd row back as numpy scalars
+        screen_pos = screen_xy[visible].astype(np.int64).tolist()
+        mammals = self.mammals
+        for i, pos in zip(visible.tolist(), screen_pos):
+            mammals[i].render(camera, show_fov, pos, bars.get(i, ()))
+
+    def energy_bar_fills(self, camera, rows, screen_x, screen_y):
+        """
+        Lay out the energy bars of the given rows, centered above their screen
+        positions. Returns {row: ((color, rect), ...)}, the screen fills drawing
+        each bar, background first.
+        """
+        if not rows.size:
+            return {}
+        # Scale bar dimensions based on zoom
+        zoom = camera.zoom
+        bar_width = BAR_WIDTH * zoom
+        bar_height = BAR_HEIGHT * zoom
+        bar_padding = BAR_PADDING * zoom
+
+        # Calculate energy percentages
+        energy_percent = np.clip(self.energy[rows] / self.max_energy[rows], 0, 1)
+        color_index = (energy_percent * 255).astype(int)
+
+        # Calculate bar positions from the whole-pixel screen positions
+        bar_x = (screen_x.astype(int) - bar_width / 2).astype(int)
+        scaled_size = self.size[rows] * zoom
+        bar_y = (screen_y.astype(int) - scaled_size / 2 - bar_height - bar_padding).astype(int)
+
+        # Ensure bar dimensions are at least 1 pixel
+        bar_width = max(1, bar_width)
+        bar_height = max(1, bar_height)
+        filled_width = np.maximum(1, (bar_width * energy_percent).astype(int))
+
+        # Surface.fill shifts rects hanging off the top or left edge instead of
+        # clipping them, so clip them here
+        left = np.maximum(bar_x, 0)
+        top = np.maximum(bar_y, 0)
+        height = bar_y + bar_height - top
+        background_width = bar_x + bar_width - left
+        filled_width = bar_x + filled_width - left
+
+        fills = {}
+        for row, x, y, h, percent, background, filled, color in zip(
+            rows.tolist(), left.tolist(), top.tolist(), height.tolist(), energy_percent.tolist(),
+            background_width.tolist(), filled_width.tolist(), color_index.tolist()
+        ):
+            if h <= 0 or background <= 0:
+                continue
+            if percent > 0 and filled > 0:
+                fills[row] = ((BAR_BACKGROUND_COLOR, (x, y, background, h)), (BAR_COLORS[color], (x, y, filled, h)))
+            else:
+                fills[row] = ((BAR_BACKGROUND_COLOR, (x, y, background, h)),)
+        return fills
+
+
+class PreyIndex:
+    """
+    A prey list together with a snapshot of its positions as an (n, 2) array,
+    bucketed into a uniform grid of cell_size cells. Built once per step for the
+    herd hunting it, with cell_size the herd's longest view distance, so a FOV
+    scan only needs the 3x3 cells around a hunter. With a filter_function only
+    the prey passing it are indexed. Prey eaten during the step are discard()ed,
+    so later searches never pick them.
+    """
+    def __init__(self, prey_list, herd, filter_function=None):
+        self.prey_list = prey_list
+        if filter_function is None:
+            self.entities = list(prey_list)
+        else:
+            self.entities = [entity for entity in prey_list if filter_function(entity)]
+        prey_herd = getattr(self.entities[0], "herd", None) if self.entities else None
+        if prey_herd is not None:
+            # Mammal prey: gather their rows of the herd array instead of one property read each
+            self.xy = prey_herd.pos[[entity.idx for entity in self.entities]]
+        else:
+            self.xy = np.array([entity.pos for entity in self.entities], dtype=float).reshape(-1, 2)
+        self.cell_size = max(herd.view_distance, 1)
+        self.grid = {}
+        cells = (self.xy // self.cell_size).astype(np.int64).tolist()
+        for i, (cx, cy) in enumerate(cells):
+            self.grid.setdefault((cx, cy), []).append(i)
+        # Which entities are still uneaten, and each entity's index
+        self.live = np.ones(len(self.entities), dtype=bool)
+        self.rows = None
+        # Everything eaten from the prey list this step
+        self.eaten = []
+
+    def discard(self, entity):
+        """Take an eaten entity out of the index so no later search picks it"""
+        self.eaten.append(entity)
+        if self.rows is None:
+            self.rows = {entity: i for i, entity in enumerate(self.entities)}
+        row = self.rows.get(entity)
+        if row is not None:
+            self.live[row] = False
+
+    def near(self, cx, cy):
+        """Indices of the uneaten entities in the 3x3 cells around cell (cx, cy)"""
+        grid = self.grid
+        rows = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = grid.get((gx, gy))
+                if cell:
+                    rows.extend(cell)
+        if rows and self.eaten:
+            rows = [row for row in rows if self.live[row]]
+        return rows
+
+
+def _herd_field(name):
+    """Property reading and writing a mammal's row of one MammalHerd array"""
+    def fget(self):
+        idx = self.idx
+        if idx < 0:
+            raise ValueError(f"{type(self).__name__} has been despawned; it no longer has a {name}")
+        return getattr(self.herd, name)[idx]
+
+    def fset(self, value):
+        idx = self.idx
+        if idx < 0:
+            raise ValueError(f"{type(self).__name__} has been despawned; it no longer has a {name}")
+        getattr(self.herd, name)[idx] = value
+
+    return property(fget, fset)
+
 
 class Mammal(Being):
+    rotates = True
+
+    # Per-mammal state stored in the herd arrays
+    pos = _herd_field("pos")
+    direction = _herd_field("direction")
+    angle = _herd_field("angle")
+    desired_angle = _herd_field("desired_angle")
+    turn_rate = _herd_field("turn_rate")
+    speed = _herd_field("speed")
+    size = _herd_field("size")
+    energy = _herd_field("energy")
+    max_energy = _herd_field("max_energy")
+    move_cost = _herd_field("move_cost")
+    alive = _herd_field("alive")
+    reproduction_cooldown = _herd_field("reproduction_cooldown")
+    decay_timer = _herd_field("decay_timer")
+    target_distance = _herd_field("target_distance")
+
     # Class variable to share delta time with all mammals
     simulation_delta_time = 1/60  # Default to 60 FPS
-    # Shared FOV surface - will be initialized when first needed
-    shared_fov_surface = None
+    # FOV scratch surfaces covering a cone's bounding box, keyed by side length
+    fov_surfaces = {}
+
+    def __init__(self, screen, config, herd):
+        # Each species of each simulation keeps its state in its own MammalHerd
+        self.herd = herd
+        self.idx = herd.add(self)
 
-    def __init__(self, screen, config):
         # default
         self.alive = True
-        original_sprite = config.get("sprite", MAMMAL_CONFIG["sprite"])
-        self.sprite = original_sprite.copy()
+        # Shared by the whole species; opacity lives in the rotation tables picked by alpha
+        self.sprite = config.get("sprite", MAMMAL_CONFIG["sprite"])
+        self.alpha = 255
         self.size = config.get("size", MAMMAL_CONFIG["size"])
+        self.radius = self.size / 2
         self.decay_timer = config.get("decay_timer", MAMMAL_CONFIG["decay_timer"])
 
         # movement
-        self.angle = random.uniform(0, 360)  # Current angle in degrees
+        self.angle = random_pool.uniform(0, 360)  # Current angle in degrees
         self.desired_angle = self.angle  # Initialize desired angle to match current angle
         self.direction = self.calculate_direction()
         self.turn_rate = config.get("turn_rate", MAMMAL_CONFIG["turn_rate"]) # how fast it can turn
@@ -439,8 +928,10 @@ class Mammal(Being):
         # vision
         self.view_distance = config.get("view_distance", MAMMAL_CONFIG["view_distance"])
         self.view_angle = config.get("view_angle", MAMMAL_CONFIG["view_angle"])
+        self.cos_half_view_angle = math.cos(math.radians(self.view_angle / 2))
         self.fov_color = config.get("fov_color", MAMMAL_CONFIG["fov_color"])
         self.fov_outline_color = config.get("fov_outline_color", MAMMAL_CONFIG["fov_outline_color"])
+        self.herd.view_distance = max(self.herd.view_distance, self.view_distance)
 
         # energy
         self.energy = config.get("initial_energy", MAMMAL_CONFIG["initial_energy"])
@@ -462,99 +953,64 @@ class Mammal(Being):
         self.target_distance = 0
 
         super().__init__(screen)
-        self.last_pos = self.pos.copy()
 
     def calculate_direction(self):
-        radian_angle = math.radians(self.angle)
-        return [math.cos(radian_angle), math.sin(radian_angle)]
+        heading = heading_index(self.angle)
+        return [COS[heading], SIN[heading]]
 
     def turn(self, angle_change):
         # Update the desired angle instead of immediately changing current angle
         self.desired_angle = (self.angle + angle_change) % 360
 
-    def update_turning(self):
-        """
-        Gradually update the current angle towards the desired angle
-        """
-        # Get delta time for current frame
-        dt = Mammal.simulation_delta_time
-        effective_turn_rate = self.turn_rate * dt / (1 + (self.speed/60)**2)
-    
-        angle_diff = (self.desired_angle - self.angle + 180) % 360 - 180
-        # Apply clamping to prevent overshooting
-        if abs(angle_diff) <= effective_turn_rate:
-            self.angle = self.desired_angle
-        else:
-            turn_direction = 1 if angle_diff > 0 else -1
-            self.angle = (self.angle + turn_direction * effective_turn_rate) % 360
-        
-        self.direction = self.calculate_direction()
-
-    def move(self):
-        # First update turning to ensure smooth rotation
-        self.update_turning()
-        
-        # Get delta time for current frame
-        dt = Mammal.simulation_delta_time
-        
-        # Apply movement based on speed per second and scale by delta time
-        self.pos[0] += self.speed * self.direction[0] * dt
-        self.pos[1] += self.speed * self.direction[1] * dt
-
-        # Boundary checks using SPAWN_AREA
-        self.pos[0] = max(SPAWN_AREA["x_min"], min(SPAWN_AREA["x_max"], self.pos[0]))
-        self.pos[1] = max(SPAWN_AREA["y_min"], min(SPAWN_AREA["y_max"], self.pos[1]))
-
-        # Scale energy consumption by delta time - move_cost is now energy per second
-        energy_cost = self.move_cost * self.speed * dt
-        self.energy -= max(energy_cost, 0)
-
     def turn_away(self):
         # Try multiple random angles to find one that leads back into the spawn area
-        for _ in range(10):  # Try up to 10 times to find a good direction
-            # Generate a random turn angle between -120 and 120 degrees
-            turn_angle = random.uniform(-120, 120)
-            
-            # Calculate new direction after turning
-            new_angle = (self.angle + turn_angle) % 360
-            radian_angle = math.radians(new_angle)
-            new_direction = [math.cos(radian_angle), math.sin(radian_angle)]
-            
-            # Project a point ahead in the new direction
-            projected_x = self.pos[0] + new_direction[0] * self.view_distance
-            projected_y = self.pos[1] + new_direction[1] * self.view_distance
-            
-            # Check if the new direction points inside the spawn area
-            if (SPAWN_AREA["x_min"] < projected_x < SPAWN_AREA["x_max"] and
-                SPAWN_AREA["y_min"] < projected_y < SPAWN_AREA["y_max"]):
-                # Found a good direction, apply the turn
-                self.turn(turn_angle)
-                return
+        # Generate all 10 candidate turn angles between -120 and 120 degrees at once
+        turn_angles = RNG.uniform(-120, 120, 10)
+        
+        # Project a point ahead in each new direction
+        headings = heading_index(self.angle + turn_angles)
+        x, y = self.pos.tolist()
+        view_distance = self.view_distance
+        projected_x = x + COS[headings] * view_distance
+        projected_y = y + SIN[headings] * view_distance
+        
+        # Check which new directions point inside the spawn area
+        inside = ((X_MIN < projected_x) & (projected_x < X_MAX) &
+                  (Y_MIN < projected_y) & (projected_y < Y_MAX))
+        if inside.any():
+            # Found a good direction, apply the first one
+            self.turn(float(turn_angles[inside.argmax()]))
+            return
         
         # If we couldn't find a good direction, make a sharp turn (180 degrees)
         self.turn(180)
 
     def border_ahead(self):
         # Calculate the point at view_distance units ahead of the herbivore
-        projected_x = self.pos[0] + self.direction[0] * self.view_distance
-        projected_y = self.pos[1] + self.direction[1] * self.view_distance
+        # (pos and direction are herd rows; read each once, as plain floats)
+        x, y = self.pos.tolist()
+        direction_x, direction_y = self.direction.tolist()
+        view_distance = self.view_distance
+        projected_x = x + direction_x * view_distance
+        projected_y = y + direction_y * view_distance
         
         # Check if the projected point is outside the spawn area
-        if (projected_x < SPAWN_AREA["x_min"] or 
-            projected_x > SPAWN_AREA["x_max"] or
-            projected_y < SPAWN_AREA["y_min"] or
-            projected_y > SPAWN_AREA["y_max"]):
+        if (projected_x < X_MIN or 
+            projected_x > X_MAX or
+            projected_y < Y_MIN or
+            projected_y > Y_MAX):
             return True
         
         return False
 
-    def draw_fov(self, camera):
+    def draw_fov(self, camera, screen_pos=None):
         global SHOW_FOV
         if not SHOW_FOV or self.view_distance <= 0 or not self.alive:
             return
 
         # Skip FOV rendering if mammal is off-screen
-        screen_pos = camera.world_to_screen(self.pos)
+        if screen_pos is None:
+            screen_pos = camera.world_to_screen(self.pos)
         scaled_view_distance = self.view_distance * camera.zoom
         
         # Skip FOV rendering if completely off-screen (with extra margin for FOV)
@@ -564,114 +1020,49 @@ class Mammal(Being):
             screen_pos[1] - scaled_view_distance > camera.screen_height):
             return
 
-        # Initialize shared surface if needed
-        if Mammal.shared_fov_surface is None or Mammal.shared_fov_surface.get_size() != (camera.screen_width, camera.screen_height):
-            Mammal.shared_fov_surface = pygame.Surface((camera.screen_width, camera.screen_height), pygame.SRCALPHA)
+        # The cone fits in a square of side 2 * radius around the mammal, so only
+        # that box is cleared, drawn on and blitted
+        radius = int(scaled_view_distance) + 1
+        size = 2 * radius
+        fov_surface = Mammal.fov_surfaces.get(size)
+        if fov_surface is None:
+            fov_surface = Mammal.fov_surfaces[size] = pygame.Surface((size, size), pygame.SRCALPHA)
+        else:
+            fov_surface.fill((0, 0, 0, 0))
         
         # Get references for clarity and performance
-        fov_surface = Mammal.shared_fov_surface
         fov_color = self.fov_color
         fov_outline_color = self.fov_outline_color
         
-        # Clear the surface for this rendering
-        fov_surface.fill((0, 0, 0, 0))
-        
-        # Calculate FOV triangle points
-        center = pygame.math.Vector2(screen_pos)
-        angle = math.radians(self.angle)
-        half_angle = math.radians(self.view_angle / 2)
-        
-        # Create FOV polygon points with fewer points for better performance
-        points = [center]
-        # Use fewer points for wider FOVs for better performance
-        step_size = max(5, min(10, int(self.view_angle / 15)))
-        steps = max(5, int(self.view_angle / step_size))
-        
-        # Calculate and add points along the arc
-        for i in range(steps + 1):
-            theta = angle - half_angle + math.radians(i * step_size)
-            point = pygame.math.Vector2()
-            point.from_polar((scaled_view_distance, math.degrees(theta)))
-            points.append(center + point)
+        # Look up the cone outline for the nearest whole-degree heading
+        arcs, edges = get_fov_shape(self.view_angle)
+        heading = int(self.angle + 0.5) % 360
+        points = [(radius, radius)] + (arcs[heading] * scaled_view_distance + radius).tolist()
         
         # Draw the FOV shape with transparency
         pygame.draw.polygon(fov_surface, fov_color, points)
         
-        # Blit the transparent surface onto the screen
-        self.screen.blit(fov_surface, (0, 0))
-        
-        # Draw FOV outline
-        start_point = pygame.math.Vector2()
-        start_point.from_polar((scaled_view_distance, math.degrees(angle - half_angle)))
-        end_point = pygame.math.Vector2()
-        end_point.from_polar((scaled_view_distance, math.degrees(angle + half_angle)))
+        # Blit the transparent box onto the screen around the mammal
+        self.screen.blit(fov_surface, (screen_pos[0] - radius, screen_pos[1] - radius))
         
         # Draw vision cone outline
-        pygame.draw.line(self.screen, fov_outline_color, center, center + start_point, max(1, int(camera.zoom/2)))
-        pygame.draw.line(self.screen, fov_outline_color, center, center + end_point, max(1, int(camera.zoom/2)))
-
-    def draw_energy_bar(self, camera):
-        # Skip drawing energy bars in performance mode
-        global PERFORMANCE_MODE
-        if PERFORMANCE_MODE:
-            return
-            
-        if not hasattr(self, 'energy'):
-            return
-
-        config = MAMMAL_CONFIG
-        # Scale bar dimensions based on zoom
-        bar_width = config["bar_width"] * camera.zoom
-        bar_height = config["bar_height"] * camera.zoom
-        bar_padding = config["bar_padding"] * camera.zoom
-        bar_background_color = config["bar_background_color"]
-
-        # Calculate energy percentage
-        energy_percent = min(1, max(0, self.energy / self.max_energy))
-        
-        # Convert world position to screen position
-        screen_pos = camera.world_to_screen(self.pos)
-        
-        # Calculate bar position (centered above the mammal)
-        bar_x = int(screen_pos[0] - bar_width/2)
-        scaled_size = self.size * camera.zoom
-        bar_y = int(screen_pos[1] - scaled_size/2 - bar_height - bar_padding)
-        
-        # Ensure bar dimensions are at least 1 pixel
-        bar_width = max(1, bar_width)
-        bar_height = max(1, bar_height)
-        
-        # Draw bar background
-        pygame.draw.rect(self.screen, bar_background_color, 
-                         (bar_x, bar_y, bar_width, bar_height))
-        
-        if energy_percent > 0:
-            # Simplify color calculation for better performance
-            if energy_percent > 0.9:
-                color = (0, 255, 0)  # Green
-            elif energy_percent > 0.7:
-                color = (255, 255, 0)  # Yellow
-            elif energy_percent > 0.2:
-                color = (255, 128, 0)  # Orange
-            else:
-                color = (255, 0, 0)  # Red
-                
-            filled_width = max(1, int(bar_width * energy_percent))
-            pygame.draw.rect(self.screen, color,
-                             (bar_x, bar_y, filled_width, bar_height))
-
-    def render(self, camera):
-        # Make sure living mammals have full opacity
-        if self.alive and hasattr(self, 'sprite') and hasattr(self.sprite, 'set_alpha'):
-            self.sprite.set_alpha(255)
-        
-        if self.alive and hasattr(self, 'view_distance') and self.view_distance > 0:
-            self.draw_fov(camera)
-        if self.alive:
-            self.draw_energy_bar(camera)
-        
+        start_point, end_point = (edges[heading] * scaled_view_distance + screen_pos).tolist()
+        pygame.draw.line(self.screen, fov_outline_color, screen_pos, start_point, max(1, int(camera.zoom/2)))
+        pygame.draw.line(self.screen, fov_outline_color, screen_pos, end_point, max(1, int(camera.zoom/2)))
+
+    def render(self, camera, show_fov=True, screen_pos=None, energy_bar=()):
+        if screen_pos is None:
+            screen_pos = camera.world_to_screen(self.pos)
+        if show_fov and self.alive and self.view_distance > 0:
+            self.draw_fov(camera, screen_pos)
+        # Energy bar fills laid out by MammalHerd.render_all(), between the FOV and the sprite
+        for color, rect in energy_bar:
+            self.screen.fill(color, rect)
         # Call the parent class render method with the camera
-        super().render(camera)
+        super().render(camera, screen_pos)
+
+    def despawn(self):
+        self.herd.remove(self)
 
     def is_alive(self):
         return self.alive
@@ -698,19 +1089,18 @@ class Mammal(Being):
         if self.can_reproduce():
             # If we're a Herbivore, create a Herbivore offspring
             if isinstance(self, Herbivore):
-                offspring = Herbivore(self.screen)
+                offspring = Herbivore(self.screen, self.herd)
             elif isinstance(self, Carnivore):
-                offspring = Carnivore(self.screen)
+                offspring = Carnivore(self.screen, self.herd)
 
             # Position offspring near parent
             max_distance = self.size * 2
+            # Keep offspring within boundaries
+            x, y = self.pos.tolist()
             offspring.pos = [
-                self.pos[0] + random.uniform(-max_distance, max_distance),
-                self.pos[1] + random.uniform(-max_distance, max_distance)
+                max(X_MIN, min(X_MAX, x + random_pool.uniform(-max_distance, max_distance))),
+                max(Y_MIN, min(Y_MAX, y + random_pool.uniform(-max_distance, max_distance)))
             ]
-            # Keep offspring within boundaries
-            offspring.pos[0] = max(SPAWN_AREA["x_min"], min(SPAWN_AREA["x_max"], offspring.pos[0]))
-            offspring.pos[1] = max(SPAWN_AREA["y_min"], min(SPAWN_AREA["y_max"], offspring.pos[1]))
                 
             offspring.energy = self.offspring_initial_energy
             offspring.reproduction_cooldown = self.reproduction_cooldown_max_offspring
@@ -721,75 +1111,72 @@ class Mammal(Being):
 
     def update(self):
         """Update method to be called each frame"""
-        dt = Mammal.simulation_delta_time
-        
-        if self.reproduction_cooldown > 0:
-            self.reproduction_cooldown -= dt
-        
         if self.energy <= 0:
             self.alive = False
             return
-        
-        self.move()
-            
+        # Movement, travel distance and timers are advanced for the whole herd in MammalHerd.step()
+
+
     def is_touching_entity(self, entity):
-        entity_size = entity.size
         # Use squared distance for efficiency (avoids square root)
-        dx = self.pos[0] - entity.pos[0]
-        dy = self.pos[1] - entity.pos[1]
-        squared_distance = dx*dx + dy*dy
+        x, y = self.pos.tolist()
+        entity_x, entity_y = entity.pos
+        dx = x - entity_x
+        dy = y - entity_y
+        touch_distance = self.radius + entity.radius
         
         # Compare squared distances for better performance
-        return squared_distance < ((self.size/2 + entity_size/2) ** 2)
+        return dx*dx + dy*dy < touch_distance * touch_distance
     
     def consume_entity(self, entity, entity_list):
         self.energy = min(self.energy + entity.energy_gain, self.max_energy)
         if entity in entity_list:
-            entity_list.remove(entity)            
+            entity_list.remove(entity)
+            entity.despawn()
                     
     def reset_target(self, target=None):
         self.current_target = target
         self.target_distance = 0
     
-    def find_target_in_fov(self, entity_list, filter_function=None, order_function=None):
-        if entity_list is None:
+    def find_target_in_fov(self, prey):
+        """Return the nearest entity of a PreyIndex inside this mammal's field of view, or False"""
+        # eat() only gets here with an index; an empty one simply finds nothing.
+        # Only entities in the grid cells around this mammal can be in view
+        x, y = self.pos.tolist()
+        cell_size = prey.cell_size
+        rows = prey.near(int(x // cell_size), int(y // cell_size))
+        if not rows:
+            return False
+        rows = np.array(rows)
+        xy = prey.xy[rows]
+        dx = xy[:, 0] - x
+        dy = xy[:, 1] - y
+        squared_distance = dx*dx + dy*dy
+        view_distance = self.view_distance
+        nearby = np.flatnonzero(squared_distance < view_distance * view_distance)
+        if not nearby.size:
             return False
-        if not order_function:
-            order_function = lambda x: x[1]
-        
-        entities = {}
-        
-        # First filter entities that are too far or don't meet criteria
-        nearby_entities = []
-        view_distance_squared = self.view_distance ** 2
-        
-        for entity in entity_list:
-            # Fast bounding box check
-            if abs(entity.pos[0] - self.pos[0]) <= self.view_distance and \
-               abs(entity.pos[1] - self.pos[1]) <= self.view_distance:
-                if filter_function is None or filter_function(entity):
-                    nearby_entities.append(entity)
-
-        for entity in nearby_entities:
-            # Use simpler arithmetic instead of np.array operations
-            dx = entity.pos[0] - self.pos[0]
-            dy = entity.pos[1] - self.pos[1]
-            squared_distance = dx*dx + dy*dy
-            
-            if squared_distance < view_distance_squared:
-                entity_angle = math.degrees(math.atan2(dy, dx))
-                angle_diff = (entity_angle - self.angle + 180) % 360 - 180
-                
-                if abs(angle_diff) <= self.view_angle / 2:
-                    # Store squared distance to avoid sqrt in sorting
-                    entities[entity] = squared_distance
         
-        sorted_entities = sorted(entities.items(), key=order_function)
-        return sorted_entities[0][0] if sorted_entities else False
+        # An entity is inside the view cone when its projection onto the heading
+        # is at least cos(view_angle / 2) times its distance; compared squared,
+        # with the sign handled separately, so no atan2 or sqrt is needed
+        heading = math.radians(self.angle)
+        squared_nearby = squared_distance[nearby]
+        projection = dx[nearby] * math.cos(heading) + dy[nearby] * math.sin(heading)
+        cos_half = self.cos_half_view_angle
+        if cos_half >= 0:
+            in_cone = (projection >= 0) & (projection * projection >= cos_half * cos_half * squared_nearby)
+        else:
+            in_cone = (projection >= 0) | (projection * projection <= cos_half * cos_half * squared_nearby)
+        in_view = nearby[in_cone]
+        if not in_view.size:
+            return False
+        return prey.entities[rows[in_view[np.argmin(squared_distance[in_view])]]]
     
     def move_towards_entity(self, entity):
-        entity_vector = [entity.pos[0] - self.pos[0], entity.pos[1] - self.pos[1]]
-        target_angle = math.degrees(math.atan2(entity_vector[1], entity_vector[0]))
+        x, y = self.pos.tolist()
+        entity_x, entity_y = entity.pos
+        target_angle = math.degrees(math.atan2(entity_y - y, entity_x - x))
         angle_diff = (target_angle - self.angle + 180) % 360 - 180
         self.turn(angle_diff)
 
@@ -801,74 +1188,65 @@ class Mammal(Being):
         else:
             dt = Mammal.simulation_delta_time
             time_adjusted_chance = self.random_turn_chance * dt
-            if random.random() < time_adjusted_chance:
-                random_direction = random.uniform(-self.random_turn_angle, self.random_turn_angle)
+            if random_pool.uniform() < time_adjusted_chance:
+                random_direction = random_pool.uniform(-self.random_turn_angle, self.random_turn_angle)
                 self.turn(random_direction)
 
-    def find_food(self, food_list=None):           
-        target = self.find_target_in_fov(food_list)
+    def find_food(self, prey):
+        target = self.find_target_in_fov(prey)
         if target:
             self.reset_target(target)
             self.move_towards_entity(target)
         else:
             self.wander()
 
-    def measure_travel_distance(self):
-        # Avoid numpy operations for simple 2D distance
-        dx = self.pos[0] - self.last_pos[0]
-        dy = self.pos[1] - self.last_pos[1]
-        d = math.sqrt(dx*dx + dy*dy)
-        
-        self.last_pos = self.pos.copy()
-        self.target_distance += d
-    
     def decay(self):
         if not self.alive:
-            # Subtract actual elapsed seconds from decay timer
-            dt = Mammal.simulation_delta_time
-            self.decay_timer -= dt
-            
+            # The decay timer counts down in MammalHerd.step()
             # Fade out sprite as it decays
-            if hasattr(self, 'sprite') and hasattr(self.sprite, 'set_alpha'):
-                self.sprite.set_alpha(60)
+            self.alpha = 60
             
             return True
         return False
     
-    def eat(self, food_list, filter_function=None):
+    def eat(self, prey, filter_function=None):
+        food_list = prey.prey_list if prey is not None else None
         if not food_list:
             self.wander()
             return
-        filtered_food_list = [entity for entity in food_list if filter_function(entity)] if filter_function else food_list
-        if self.current_target and self.current_target in filtered_food_list:
-            if self.is_touching_entity(self.current_target):
-                self.consume_entity(self.current_target, food_list)
+        # Only the current target needs checking; the prey index was already
+        # filtered once for the whole species when it was built
+        target = self.current_target
+        if target and target in food_list and (filter_function is None or filter_function(target)):
+            if self.is_touching_entity(target):
+                self.consume_entity(target, food_list)
+                prey.discard(target)
                 self.reset_target()
                 self.speed = self.base_speed
             else:
-                self.move_towards_entity(self.current_target)
+                self.move_towards_entity(target)
         else:
-            self.find_food(filtered_food_list)
+            self.find_food(prey)
 
 
 class Herbivore(Mammal):
-    def __init__(self, screen):
+    def __init__(self, screen, herd):
         config = HERBIVORE_CONFIG
-        super().__init__(screen, config)
+        super().__init__(screen, config, herd)
     
-    def food_filter(self, plant):
+    @staticmethod
+    def food_filter(plant):
         return plant.growth_stage > 0
 
-    def figure_out(self, plant_list=None):
+    def figure_out(self, plants=None):
         '''
         Hardcoded behaviour
         '''
         if self.decay():
             return None
-        self.measure_travel_distance()
         new_offspring = self.reproduce()
         if self.is_hungry():
-            self.eat(plant_list, self.food_filter)
+            self.eat(plants, self.food_filter)
         else:
             self.wander()
         self.update()
@@ -876,20 +1254,19 @@ class Herbivore(Mammal):
 
 
 class Carnivore(Mammal):
-    def __init__(self, screen):
+    def __init__(self, screen, herd):
         config = CARNIVORE_CONFIG
-        super().__init__(screen, config)
+        super().__init__(screen, config, herd)
 
-    def figure_out(self, herbivore_list=None):
+    def figure_out(self, herbivores=None):
         '''
         Hardcoded behaviour
         '''
         if self.decay():
             return None
-        self.measure_travel_distance()
         new_offspring = self.reproduce()
         if self.is_hungry():
-            self.eat(herbivore_list)
+            self.eat(herbivores)
         else:
             self.wander()
         self.update()
@@ -907,6 +1284,8 @@ class CreatureSimulation(ParallelEnv):
     def __init__(self, render_mode=None):
         self.possible_agents = []
         self.agent_info = {}
+        # Reverse of agent_info: mammal -> agent name
+        self.agent_names = {}
         self.plants = []
         self.render_mode = render_mode
         self.frames = 0
@@ -914,6 +1293,8 @@ class CreatureSimulation(ParallelEnv):
         self.herbivores = []
         self.carnivores = []
         self.smarties = []
+        # Scratch surface the minimap pixels are written to each frame
+        self.minimap_surface = None
         
         # Time tracking for frame-rate independence
         self.delta_time = 1/60  # Default to 60 FPS (in seconds)
@@ -923,14 +1304,20 @@ class CreatureSimulation(ParallelEnv):
         if self.render_mode == "human":
             pygame.init()
             self.screen = pygame.display.set_mode(SCREEN_SIZE)
+            init_sprites()
             self.clock = pygame.time.Clock()
             self.last_frame_time = pygame.time.get_ticks() / 1000.0  # Initial time in seconds
             self.camera = Camera(SCREEN_SIZE[0], SCREEN_SIZE[1])
             
             # For displaying stats
             self.font = pygame.font.SysFont("Arial", 16)
+            # Rendered HUD text keyed by (text, color); most of it is the same every frame
+            self.text_cache = {}
             self.show_stats = True
 
+        # Pick the step implementation once; headless runs never touch pygame while stepping
+        self.step = self._step_render if self.render_mode == "human" else self._step_headless
+
         # Initialize populations
         self._spawn_initial_population()
 
@@ -944,9 +1331,12 @@ class CreatureSimulation(ParallelEnv):
 
     def _spawn_initial_population(self):
         # Spawn plants with random growth stages
+        # Every population starts with fresh state of its own
+        self.plant_grid = PlantGrid()
+        self.herbivore_herd = MammalHerd()
+        self.carnivore_herd = MammalHerd()
         for _ in range(PLANT_CONFIG["initial_plants"]):
-            existing_plants = [p.pos for p in self.plants]
-            plant = Plant.create(self.screen, existing_plants)
+            plant = Plant.create(self.screen, self.plant_grid)
             if plant is not None:
                 self.plants.append(plant)
             else:
@@ -958,30 +1348,32 @@ class CreatureSimulation(ParallelEnv):
                 "type": "herbivore",
                 "initial_amount": HERBIVORE_CONFIG["initial_amount"],
                 "constructor": Herbivore,
+                "herd": self.herbivore_herd,
                 "creature_list": self.herbivores
             },
             {
                 "type": "carnivore",
                 "initial_amount": CARNIVORE_CONFIG["initial_amount"],
                 "constructor": Carnivore,
+                "herd": self.carnivore_herd,
                 "creature_list": self.carnivores
             }
         ]
 
         for creature in creature_list:
             for i in range(creature["initial_amount"]):
-                mammal = creature["constructor"](self.screen)
+                mammal = creature["constructor"](self.screen, creature["herd"])
                 agent_name = f"{creature['type']}_{i}"
                 self.possible_agents.append(agent_name)
                 self.agent_info[agent_name] = mammal
+                self.agent_names[mammal] = agent_name
                 creature["creature_list"].append(mammal)
 
     def _spawn_new_plants(self):
         time_adjusted_chance = PLANT_CONFIG["spawn_rate"] * self.delta_time
         
-        if random.random() < time_adjusted_chance:
-            existing_plants = [p.pos for p in self.plants]
-            plant = Plant.create(self.screen, existing_plants, growth_stage=0)
+        if random_pool.uniform() < time_adjusted_chance:
+            plant = Plant.create(self.screen, self.plant_grid, growth_stage=0)
             if plant is not None:
                 self.plants.append(plant)
             else:
@@ -990,27 +1382,32 @@ class CreatureSimulation(ParallelEnv):
     def reset(self):
         self.possible_agents = []
         self.agent_info = {}
+        self.agent_names = {}
         self.plants = []
         self.herbivores = []
         self.carnivores = []  # Reset carnivores list
         self._spawn_initial_population()
         return self._get_observations()
 
-    def handle_mammals(self, mammal_list, prey_list=None, mammal_type="mammal"):
+    def handle_mammals(self, mammal_list, herd, prey_list=None, mammal_type="mammal", prey_filter=None):
         """
         Generic handler for offspring generation and despawning
         
         Args:
             mammal_list: List of mammals to update
+            herd: MammalHerd holding the state of the mammals in mammal_list
             prey_list: List of potential prey (plants for herbivores, herbivores for carnivores)
             mammal_type: String identifier for the type of mammal (for agent naming)
+            prey_filter: Optional function selecting which prey the mammals can eat
         """
         dead_mammals = []
         new_mammals = []
+        # Prey positions as one gridded array, shared by every mammal's FOV scan this step
+        prey = PreyIndex(prey_list, herd, prey_filter) if prey_list is not None else None
         
         for mammal in mammal_list:
             # Update behavior and check for reproduction
-            offspring = mammal.figure_out(prey_list)
+            offspring = mammal.figure_out(prey)
             
             if offspring:
                 new_mammals.append(offspring)
@@ -1021,36 +1418,49 @@ class CreatureSimulation(ParallelEnv):
         # Add new mammals born this frame
         mammal_list.extend(new_mammals)
         
-        # Remove despawnable mammals
+        # Move the whole herd at once
+        herd.step(self.delta_time)
+
+        # Prey eaten this step are gone too (consume_entity already despawned them)
+        if prey is not None and prey.eaten:
+            self._remove_agents(prey.eaten)
+
+        # Remove despawnable mammals in one pass over the list
+        if not dead_mammals:
+            return
+        dead = set(dead_mammals)
+        mammal_list[:] = [mammal for mammal in mammal_list if mammal not in dead]
         for dead_mammal in dead_mammals:
-            if dead_mammal in mammal_list:
-                mammal_list.remove(dead_mammal)
-            
-            # Find and remove associated agent references
-            agents_to_remove = []
-            for agent_name, agent_info in self.agent_info.items():
-                if agent_info == dead_mammal:
-                    agents_to_remove.append(agent_name)
-            
-            for agent_name in agents_to_remove:
-                if agent_name in self.possible_agents:
-                    self.possible_agents.remove(agent_name)
-                if agent_name in self.agent_info:
-                    del self.agent_info[agent_name]
+            dead_mammal.despawn()
+        self._remove_agents(dead_mammals)
+
+    def _remove_agents(self, mammals):
+        """Remove the agent references of mammals that left the simulation"""
+        removed_agents = False
+        for mammal in mammals:
+            agent_name = self.agent_names.pop(mammal, None)
+            if agent_name is not None:
+                del self.agent_info[agent_name]
+                removed_agents = True
+        if removed_agents:
+            self.possible_agents = [name for name in self.possible_agents if name in self.agent_info]
+
+    def _step_render(self, actions):
+        """step() in human mode: sync delta time with the wall clock, then advance"""
+        # Make sure delta time is set for the simulation
+        # This is critical if render() isn't called every step
+        current_time = pygame.time.get_ticks() / 1000.0
+        self.delta_time = min(current_time - self.last_frame_time, 0.1)
+        self.last_frame_time = current_time
+        return self._step_headless(actions)
 
-    def step(self, actions):
+    def _step_headless(self, actions):
+        """step() without a display: advance the simulation by the fixed delta time"""
         self.frames += 1
         rewards = {}
         dones = {}
         infos = {}
 
-        # Make sure delta time is set for the simulation
-        # This is critical if render() isn't called every step
-        if self.last_frame_time is not None and self.render_mode == "human":
-            current_time = pygame.time.get_ticks() / 1000.0
-            self.delta_time = min(current_time - self.last_frame_time, 0.1)
-            self.last_frame_time = current_time
-        
         # Share delta time with all mammals
         Mammal.simulation_delta_time = self.delta_time
 
@@ -1060,14 +1470,14 @@ class CreatureSimulation(ParallelEnv):
         self._spawn_new_plants()
 
         # Handle mammals (reproduction and death)
-        self.handle_mammals(self.herbivores, self.plants, "herbivore")
-        self.handle_mammals(self.carnivores, self.herbivores, "carnivore")
+        self.handle_mammals(self.herbivores, self.herbivore_herd, self.plants, "herbivore", Herbivore.food_filter)
+        self.handle_mammals(self.carnivores, self.carnivore_herd, self.herbivores, "carnivore")
 
         return self._get_observations(), rewards, dones, infos
 
     def _handle_input(self):
         """Handle user input for camera controls"""
-        global SHOW_FOV, PERFORMANCE_MODE
+        global SHOW_FOV, PERFORMANCE_MODE, HIDE_ZOOMED_OUT_DETAILS
         
         keys = pygame.key.get_pressed()
         mouse_buttons = pygame.mouse.get_pressed()
@@ -1145,6 +1555,9 @@ class CreatureSimulation(ParallelEnv):
                 elif event.key == pygame.K_f:
                     # Toggle FOV visibility
                     SHOW_FOV = not SHOW_FOV
+                elif event.key == pygame.K_d:
+                    # Toggle hiding FOV and energy bars when zoomed out
+                    HIDE_ZOOMED_OUT_DETAILS = not HIDE_ZOOMED_OUT_DETAILS
                 elif event.key == pygame.K_p:
                     # Toggle performance mode
                     PERFORMANCE_MODE = not PERFORMANCE_MODE
@@ -1183,16 +1596,16 @@ class CreatureSimulation(ParallelEnv):
             pygame.quit()
             return
         
+        # Fix the camera transform for everything drawn this frame
+        self.camera.begin_frame()
+
         # Clear the screen
         self.screen.fill(BACKGROUND_COLOR)
         
-        # Render world entities
-        for plant in self.plants:
-            plant.render(self.camera)
-        for herbivore in self.herbivores:
-            herbivore.render(self.camera)
-        for carnivore in self.carnivores:
-            carnivore.render(self.camera)
+        # Render world entities; plants and mammals are culled against the view in batches
+        self._render_plants()
+        self.herbivore_herd.render_all(self.screen, self.camera)
+        self.carnivore_herd.render_all(self.screen, self.camera)
         for smartie in self.smarties:
             smartie.render(self.camera)
 
@@ -1205,28 +1618,64 @@ class CreatureSimulation(ParallelEnv):
             self._draw_stats()
         
         # Display zoom level and performance mode status
-        zoom_text = self.font.render(f"Zoom: {self.camera.zoom:.2f}x", True, (0, 0, 0))
+        zoom_text = self._text(f"Zoom: {self.camera.zoom:.2f}x", (0, 0, 0))
         self.screen.blit(zoom_text, (10, SCREEN_SIZE[1] - 25))
         
         # Display FOV toggle status
         fov_status = "ON" if SHOW_FOV else "OFF"
         fov_color = (0, 120, 0) if SHOW_FOV else (120, 0, 0)
-        fov_text = self.font.render(f"FOV: {fov_status} (F)", True, fov_color)
+        fov_text = self._text(f"FOV: {fov_status} (F)", fov_color)
         self.screen.blit(fov_text, (150, SCREEN_SIZE[1] - 25))
         
         # Display performance mode status
         perf_status = "ON" if PERFORMANCE_MODE else "OFF"
         perf_color = (0, 120, 0) if PERFORMANCE_MODE else (120, 0, 0)
-        perf_text = self.font.render(f"Performance Mode: {perf_status} (P)", True, perf_color)
+        perf_text = self._text(f"Performance Mode: {perf_status} (P)", perf_color)
         self.screen.blit(perf_text, (300, SCREEN_SIZE[1] - 25))
-        
+
+        # Display whether FOV cones and energy bars are hidden when zoomed out
+        details_status = "ON" if HIDE_ZOOMED_OUT_DETAILS else "OFF"
+        details_color = (0, 120, 0) if HIDE_ZOOMED_OUT_DETAILS else (120, 0, 0)
+        details_text = self._text(f"Hide Zoomed-out Details: {details_status} (D)", details_color)
+        self.screen.blit(details_text, (520, SCREEN_SIZE[1] - 25))
+
         # Display controls hint
-        controls_text = self.font.render("Controls: Arrows/right-click drag to pan, +/- or mouse wheel to zoom, Tab for stats", True, (0, 0, 0))
+        controls_text = self._text("Controls: Arrows/right-click drag to pan, +/- or mouse wheel to zoom, Tab for stats, D to hide details when zoomed out", (0, 0, 0))
         self.screen.blit(controls_text, (10, SCREEN_SIZE[1] - 50))
 
         pygame.display.flip()
         self.clock.tick(self.metadata["render_fps"])
 
+    def _render_plants(self):
+        """Render the plants on screen, culled with one vectorized test"""
+        plants = self.plants
+        if not plants:
+            return
+        camera = self.camera
+        positions = np.array([plant.pos for plant in plants], dtype=float)
+        # Truncated like Camera.world_to_screen, with Being.render's 50 pixel margin
+        screen_pos = camera.world_to_screen_batch(positions).astype(np.int64)
+        screen_x = screen_pos[:, 0]
+        screen_y = screen_pos[:, 1]
+        visible = np.flatnonzero(
+            (screen_x >= -50) & (screen_x <= camera.screen_width + 50) &
+            (screen_y >= -50) & (screen_y <= camera.screen_height + 50)
+        )
+        for i, pos in zip(visible.tolist(), screen_pos[visible].tolist()):
+            plants[i].render(camera, pos)
+
+    def _text(self, text, color):
+        """Return text rendered in the HUD font, reusing the surface from earlier frames"""
+        key = (text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # Counters and FPS keep producing new strings; start over once the cache fills up
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                self.text_cache.clear()
+            surface = self.font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+
     def _draw_minimap(self):
         """Draw a small minimap in the corner showing the camera position in the world"""
         # Skip minimap when zoomed out far enough (we can already see most of the world)
@@ -1242,58 +1691,40 @@ class CreatureSimulation(ParallelEnv):
             minimap_size, minimap_size
         )
         
-        # Draw minimap background
-        pygame.draw.rect(self.screen, (240, 240, 240), minimap_rect)
-        pygame.draw.rect(self.screen, (0, 0, 0), minimap_rect, 1)
-        
         # Calculate ratio of world to minimap
         x_ratio = minimap_size / WORLD_SIZE[0]
         y_ratio = minimap_size / WORLD_SIZE[1]
         
-        # Use more efficient drawing - only draw what's actually visible
-        # Limit the number of entities drawn to avoid performance issues
-        max_entities = 200
-        
-        # Draw dots for entities on minimap - limit to most important ones if too many
-        plant_count = 0
-        for plant in self.plants:
-            # Apply a rate limit when many plants exist
-            if len(self.plants) > max_entities and random.random() > max_entities / len(self.plants):
-                continue
-                
-            pos = (minimap_rect.left + int(plant.pos[0] * x_ratio),
-                minimap_rect.top + int(plant.pos[1] * y_ratio))
-            # Use a smaller radius when many plants exist
-            radius = 1
-            pygame.draw.circle(self.screen, (0, 150, 0), pos, radius)
-            plant_count += 1
-            if plant_count > max_entities:
-                break
-            
-        # Always draw all mammals (they're more important)
-        for herbivore in self.herbivores:
-            pos = (
-                minimap_rect.left + int(herbivore.pos[0] * x_ratio),
-                minimap_rect.top + int(herbivore.pos[1] * y_ratio)
-            )
-            pygame.draw.circle(self.screen, (0, 0, 255), pos, 2)
-            
-        for carnivore in self.carnivores:
-            pos = (
-                minimap_rect.left + int(carnivore.pos[0] * x_ratio),
-                minimap_rect.top + int(carnivore.pos[1] * y_ratio)
-            )
-            pygame.draw.circle(self.screen, (255, 0, 0), pos, 2)
+        # Build the minimap as a pixel array (indexed [x, y]) and blit it in one go:
+        # every entity becomes a dot stamped with a single fancy-indexed write
+        pixels = np.full((minimap_size, minimap_size, 3), 240, dtype=np.uint8)
+        ratio = np.array([x_ratio, y_ratio])
+        plant_pos = np.array([plant.pos for plant in self.plants], dtype=float).reshape(-1, 2)
+        herbivore_herd = self.herbivore_herd
+        carnivore_herd = self.carnivore_herd
+        layers = (
+            (plant_pos, (0, 150, 0), 1),
+            (herbivore_herd.pos[:herbivore_herd.count], (0, 0, 255), 2),
+            (carnivore_herd.pos[:carnivore_herd.count], (255, 0, 0), 2),
+        )
+        for positions, color, radius in layers:
+            centers = (positions * ratio).astype(np.int64)
+            points = (centers[:, None, :] + get_dot_offsets(radius)).reshape(-1, 2)
+            inside = ((points >= 0) & (points < minimap_size)).all(axis=1)
+            points = points[inside]
+            pixels[points[:, 0], points[:, 1]] = color
+        
+        if self.minimap_surface is None:
+            self.minimap_surface = pygame.Surface((minimap_size, minimap_size))
+        pygame.surfarray.blit_array(self.minimap_surface, pixels)
+        self.screen.blit(self.minimap_surface, minimap_rect.topleft)
+        pygame.draw.rect(self.screen, (0, 0, 0), minimap_rect, 1)
         
         # Draw current view area on minimap
         view_width = (self.camera.screen_width / self.camera.zoom) * x_ratio
         view_height = (self.camera.screen_height / self.camera.zoom) * y_ratio
-        view_x = minimap_rect.left + int(
-            (self.camera.position[0] - self.camera.screen_width / (2 * self.camera.zoom)) * x_ratio
-        )
-        view_y = minimap_rect.top + int(
-            (self.camera.position[1] - self.camera.screen_height / (2 * self.camera.zoom)) * y_ratio
-        )
+        view_x = minimap_rect.left + int(self.camera.offset_x * x_ratio)
+        view_y = minimap_rect.top + int(self.camera.offset_y * y_ratio)
         
         # Clamp view rectangle to minimap
         view_rect = pygame.Rect(view_x, view_y, view_width, view_height)
@@ -1324,16 +1755,23 @@ class CreatureSimulation(ParallelEnv):
         
         # Draw each line of text
         for i, text in enumerate(stats_text):
-            text_surf = self.font.render(text, True, (0, 0, 0))
+            text_surf = self._text(text, (0, 0, 0))
             self.screen.blit(text_surf, (20, 15 + i * 20))
 
     def _get_observations(self):
         observations = {}
+        # Read the herd arrays once rather than three properties per herbivore
+        herd = self.herbivore_herd
+        n = herd.count
+        positions = herd.pos[:n].tolist()
+        energies = herd.energy[:n].tolist()
+        directions = herd.direction[:n].tolist()
         for herbivore in self.herbivores:
+            idx = herbivore.idx
             observations[herbivore] = {
-                "position": herbivore.pos,
-                "energy": herbivore.energy,
-                "velocity": herbivore.direction,
+                "position": positions[idx],
+                "energy": energies[idx],
+                "velocity": directions[idx],
                 "state": "active",  # Example state
                 "target": None  # Example target
             }
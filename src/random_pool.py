@@ -0,0 +1,30 @@
+"""
+Pooled random numbers for scalar draws on per-frame paths.
+"""
+import numpy as np
+
+POOL_SIZE = 4096
+
+
+class UniformPool:
+    """
+    Hands out uniform floats one at a time from a buffer that is refilled in bulk,
+    so scalar draws cost a list index instead of a full RNG call each.
+    """
+    def __init__(self, size: int = POOL_SIZE, rng: np.random.Generator | None = None):
+        self.size = size
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._values: list[float] = []
+        self._pos = size
+
+    def uniform(self, low: float = 0.0, high: float = 1.0) -> float:
+        if self._pos >= self.size:
+            self._values = self.rng.random(self.size).tolist()
+            self._pos = 0
+        u = self._values[self._pos]
+        self._pos += 1
+        return low + (high - low) * u
+
+
+# Shared by the entity systems
+uniform_pool = UniformPool()
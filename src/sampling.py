@@ -0,0 +1,61 @@
+"""
+Point sampling helpers used when populating the world.
+"""
+import numpy as np
+
+# Upper bound on candidates tested per round; keeps the pairwise distance matrices small
+MAX_BATCH = 512
+
+
+def _sq_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise squared distances between the rows of a and b, shape (len(a), len(b))."""
+    return np.einsum("ij,ij->i", a, a)[:, None] + np.einsum("ij,ij->i", b, b)[None, :] - 2 * (a @ b.T)
+
+
+def spaced_uniform(
+    width: float,
+    height: float,
+    r: float,
+    count: int,
+    attempts_per_point: int = 20,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Sample up to count uniformly distributed points in a width x height rectangle
+    so that no two points are closer than r.
+
+    Candidates are drawn in batches and each batch is filtered in one vectorised
+    pass: a candidate is rejected if it is too close to an already placed point or
+    to an earlier candidate of the same batch.
+
+    Args:
+        width: Width of the sampling area
+        height: Height of the sampling area
+        r: Minimum distance between any two points
+        count: Number of points wanted
+        attempts_per_point: Candidates drawn per wanted point
+        rng: Generator to draw candidates from; a fresh default_rng() if omitted
+
+    Returns:
+        A (n, 2) array of points, n <= count, with origin at the bottom-left of the area
+    """
+    placed = np.empty((0, 2))
+    if count <= 0 or width <= 0 or height <= 0:
+        return placed
+
+    if rng is None:
+        rng = np.random.default_rng()
+    r_sq = r * r
+    budget = count * attempts_per_point
+    while len(placed) < count and budget > 0:
+        missing = count - len(placed)
+        batch = min(budget, MAX_BATCH, 4 * missing)
+        budget -= batch
+        candidates = rng.uniform((0.0, 0.0), (width, height), size=(batch, 2))
+        # close[i, j] with i < j: candidate j conflicts with the earlier candidate i
+        close = np.triu(_sq_distances(candidates, candidates) < r_sq, 1)
+        keep = ~close.any(axis=0)
+        if len(placed):
+            keep &= ~(_sq_distances(candidates, placed) < r_sq).any(axis=1)
+        placed = np.concatenate((placed, candidates[keep][:missing]))
+    return placed
@@ -7,7 +7,6 @@ from simulation.camera_controller import CameraController
 from typing import Optional
 from entities.entity_manager import EntityManager
 from input_controller import CameraMode, InputController, InputTargets
-from sprite_manager import sprite_manager
 
 TILE_SCALING = 1.0
 DEFAULT_DAMPING = .6
@@ -36,10 +35,10 @@ class SimulationWindow(arcade.Window):
         )
         self.background_color = arcade.color.AMAZON
         self.entity_manager: Optional[EntityManager] = None
+        self._pending_resize: Optional[tuple[int, int]] = None
 
     def setup(self):
         """Set up the game environment. Call this function to restart the game."""
-        sprite_manager.load_all_sprite_sheets()
         self.entity_manager = EntityManager()
         map_width, map_height = self.entity_manager.get_map_size()
         self.camera_controller.setup(map_width, map_height)
@@ -48,13 +47,15 @@ class SimulationWindow(arcade.Window):
     def on_resize(self, width: int, height: int):
         """Handle window resizing events."""
         super().on_resize(width, height)
-        self.camera_controller.handle_resize(width, height)
+        # Dragging a window edge fires many resize events per frame; the camera
+        # only needs the latest size, applied once in on_update
+        self._pending_resize = (width, height)
 
     def on_draw(self):
         """Render the screen."""
         self.clear()
         self.camera_controller.use()
-        self.entity_manager.scene.draw()
+        self.entity_manager.draw(self.camera_controller.view_rect())
 
     def on_mouse_drag(self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int):
         """Handle mouse drag events for camera panning."""
@@ -74,6 +75,9 @@ class SimulationWindow(arcade.Window):
 
     def on_update(self, delta_time):
         """Update game logic."""
+        if self._pending_resize is not None:
+            self.camera_controller.handle_resize(*self._pending_resize)
+            self._pending_resize = None
         self.input_controller.update(delta_time)
         self.entity_manager.update(delta_time)
 
@@ -1,5 +1,11 @@
 import arcade
 
+# Pan keys, bound once since update_panning reads them every frame a key is held
+KEY_LEFT = arcade.key.LEFT
+KEY_RIGHT = arcade.key.RIGHT
+KEY_UP = arcade.key.UP
+KEY_DOWN = arcade.key.DOWN
+
 class MapBounds:
     def __init__(self, width, height, padding):
         self.width = width
@@ -20,6 +26,8 @@ class MapBounds:
 class CameraController:
     def __init__(self, camera_settings, window):
         self.camera = None
+        # Set once setup() has created the camera; input handlers check it before acting
+        self.ready = False
         self.window = window
         self.map_bounds = None
         self.padding = camera_settings["PADDING"] # pixels of padding allowed outside map bounds
@@ -28,9 +36,13 @@ class CameraController:
         self.zoom_factor = camera_settings["ZOOM_FACTOR"]
         self.pan_rate = camera_settings["PAN_RATE"]         # pixels per second
         self.min_allowed_zoom = camera_settings["MIN_ZOOM"]
+        self._x_range = self._y_range = (0.0, 0.0)
+        self._view_offsets = (0.0, 0.0, 0.0, 0.0)
+        self._drag_dx = self._drag_dy = 0
 
     def setup(self, map_width, map_height):
         self.camera = arcade.Camera2D()
+        self.ready = True
         self.map_bounds = MapBounds(map_width, map_height, self.padding)
         self.update_min_zoom()
         self.center_camera()
@@ -44,6 +56,7 @@ class CameraController:
 
         self.min_zoom = max(min(zoom_for_width, zoom_for_height), self.min_allowed_zoom)
         self.camera.zoom = max(self.min_zoom, self.camera.zoom)
+        self.update_clamp_bounds()
 
     def center_camera(self):
         if not self.map_bounds:
@@ -51,42 +64,57 @@ class CameraController:
 
         self.camera.position = self.map_bounds.center
 
-    def clamp_position(self, x=None, y=None):
-        if x is None:
-            x = self.camera.position[0]
-        if y is None:
-            y = self.camera.position[1]
+    def update_clamp_bounds(self):
+        """Cache the camera position limits; they only change with the projection (window size and zoom)."""
         if not self.map_bounds:
-            return x, y
-
-        # self.camera.grips.contains(x, y)
-
-        visible_width = self.camera.projection.width
-        visible_height = self.camera.projection.height
+            return
 
-        min_x = self.map_bounds.left + visible_width / 2
-        max_x = self.map_bounds.right - visible_width / 2
-        min_y = self.map_bounds.bottom + visible_height / 2
-        max_y = self.map_bounds.top - visible_height / 2
-        
+        projection = self.camera.projection
+        self._view_offsets = (projection.left, projection.right, projection.bottom, projection.top)
+        visible_width = projection.width
+        visible_height = projection.height
         (center_x, center_y) = self.map_bounds.center
 
-        # Handle map smaller than viewport
+        # Handle map smaller than viewport by pinning that axis to the map center
         if visible_width > self.map_bounds.full_width:
-            x = center_x
+            self._x_range = (center_x, center_x)
         else:
-            x = max(min_x, min(x, max_x))
+            self._x_range = (self.map_bounds.left + visible_width / 2, self.map_bounds.right - visible_width / 2)
 
         if visible_height > self.map_bounds.full_height:
-            y = center_y
+            self._y_range = (center_y, center_y)
         else:
-            y = max(min_y, min(y, max_y))
+            self._y_range = (self.map_bounds.bottom + visible_height / 2, self.map_bounds.top - visible_height / 2)
+
+    def clamp_position(self, x=None, y=None):
+        if x is None or y is None:
+            (camera_x, camera_y) = self.camera.position
+            if x is None:
+                x = camera_x
+            if y is None:
+                y = camera_y
+        if not self.map_bounds:
+            return x, y
+
+        # self.camera.grips.contains(x, y)
+
+        min_x, max_x = self._x_range
+        min_y, max_y = self._y_range
+        x = max(min_x, min(x, max_x))
+        y = max(min_y, min(y, max_y))
 
         self.camera.position = (x, y)
 
+    def view_rect(self):
+        """World-space (left, right, bottom, top) of the area the camera shows."""
+        x, y = self.camera.position
+        left, right, bottom, top = self._view_offsets
+        return x + left, x + right, y + bottom, y + top
+
     def handle_resize(self, width, height):
         self.update_min_zoom()
         self.camera.match_window()
+        self.update_clamp_bounds()
         self.clamp_position()
 
     def apply_zoom(self, direction):
@@ -96,33 +124,36 @@ class CameraController:
             self.camera.zoom = max(self.camera.zoom / self.zoom_factor, self.min_zoom)
         else:
             raise ValueError(f"Invalid zoom direction: {direction}. Only 'in' or 'out' are allowed.")
+        self.update_clamp_bounds()
         self.clamp_position()
 
     def handle_drag(self, dx, dy):
-        world_dx = dx / self.camera.zoom
-        world_dy = dy / self.camera.zoom
-        new_x = self.camera.position[0] - world_dx
-        new_y = self.camera.position[1] - world_dy
-        self.clamp_position(new_x, new_y)
+        # Mouse motion can arrive many times per frame; deltas are summed here
+        # and applied once per frame by apply_drag()
+        self._drag_dx += dx
+        self._drag_dy += dy
+
+    def apply_drag(self):
+        dx, dy = self._drag_dx, self._drag_dy
+        if not (dx or dy):
+            return
+        self._drag_dx = self._drag_dy = 0
+        camera = self.camera
+        inv_zoom = 1.0 / camera.zoom
+        (old_x, old_y) = camera.position
+        self.clamp_position(old_x - dx * inv_zoom, old_y - dy * inv_zoom)
 
     def update_panning(self, pressed_keys, delta_time):
-        dx = dy = 0
-        if arcade.key.LEFT in pressed_keys:
-            dx -= self.pan_rate * delta_time
-        if arcade.key.RIGHT in pressed_keys:
-            dx += self.pan_rate * delta_time
-        if arcade.key.UP in pressed_keys:
-            dy += self.pan_rate * delta_time
-        if arcade.key.DOWN in pressed_keys:
-            dy -= self.pan_rate * delta_time
-
-        if dx or dy:
+        # Each axis is -1, 0 or 1 depending on which arrow keys are held;
+        # opposite keys cancel out
+        held = pressed_keys.held
+        kx = held[KEY_RIGHT] - held[KEY_LEFT]
+        ky = held[KEY_UP] - held[KEY_DOWN]
+
+        if kx or ky:
             (old_x, old_y) = self.camera.position
-            world_dx = dx / self.camera.zoom
-            world_dy = dy / self.camera.zoom
-            new_x = old_x + world_dx
-            new_y = old_y + world_dy
-            self.clamp_position(new_x, new_y)
+            step = self.pan_rate * delta_time / self.camera.zoom
+            self.clamp_position(old_x + kx * step, old_y + ky * step)
 
     def use(self):
         self.camera.use()
@@ -2,6 +2,12 @@
 Configuration for sprites and sprite sheets.
 """
 
+import math
+
+# Creature art faces up; headings are measured counter-clockwise from +x,
+# so a body angle of heading + SPRITE_ANGLE_OFFSET points the art forward.
+SPRITE_ANGLE_OFFSET = -math.pi / 2
+
 # Sprite sheet paths
 SPRITE_SHEETS = {
     # "creatures": "assets/images/sprites2.png",
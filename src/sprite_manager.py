@@ -15,6 +15,7 @@ class SpriteManager:
         """Initialize the sprite manager."""
         self._sprite_sheets: Dict[str, arcade.SpriteSheet] = {}
         self._sprite_configs: Dict[str, Dict[str, Tuple[int, int, int, int, float]]] = {}
+        self._texture_cache: Dict[Tuple[str, str, bool], arcade.Texture] = {}
         self._loaded: bool = False
         self._adjustment_step = 1  # Default step size for adjustments
         # self.handler_keys = [arcade.key.W, arcade.key.A, arcade.key.S, arcade.key.D, arcade.key.Q, arcade.key.E, arcade.key.F]
@@ -37,11 +38,28 @@ class SpriteManager:
         """
         if self._loaded:
             return
-        for sheet_name, path in SPRITE_SHEETS.items():
-            print(f"Loading sprite sheet: {sheet_name} from {path}")
-            self.load_sprite_sheet(sheet_name, path)
+        for sheet_name in SPRITE_SHEETS:
+            self.ensure_sprite_sheet(sheet_name)
         self._loaded = True
         
+    def ensure_sprite_sheet(self, name: str) -> bool:
+        """
+        Load a sprite sheet from SPRITE_SHEETS the first time it is needed.
+
+        Args:
+            name: Name of the sprite sheet
+
+        Returns:
+            True if the sheet is loaded, False if it is not configured
+        """
+        if name in self._sprite_sheets:
+            return True
+        if name not in SPRITE_SHEETS:
+            return False
+        print(f"Loading sprite sheet: {name} from {SPRITE_SHEETS[name]}")
+        self.load_sprite_sheet(name, SPRITE_SHEETS[name])
+        return True
+
     def load_sprite_sheet(self, name: str, path: str) -> None:
         """
         Load a sprite sheet into memory and automatically register its sprite configurations.
@@ -90,6 +108,7 @@ class SpriteManager:
                           y_up: bool = True) -> Optional[arcade.Texture]:
         """
         Get a sprite texture from a sprite sheet.
+        The sheet is loaded on first use and each texture is cut from it only once.
         
         Args:
             sheet_name: Name of the sprite sheet
@@ -99,7 +118,12 @@ class SpriteManager:
         Returns:
             The sprite texture or None if not found
         """
-        if sheet_name not in self._sprite_sheets or sheet_name not in self._sprite_configs:
+        cache_key = (sheet_name, sprite_name, y_up)
+        texture = self._texture_cache.get(cache_key)
+        if texture is not None:
+            return texture
+
+        if not self.ensure_sprite_sheet(sheet_name) or sheet_name not in self._sprite_configs:
             return None
             
         if sprite_name not in self._sprite_configs[sheet_name]:
@@ -112,6 +136,7 @@ class SpriteManager:
         # Arcade textures don't apply scaling by themselves; we attach the intended
         # scale here so sprites can consistently pick it up at construction time.
         texture.properties["scale"] = scale
+        self._texture_cache[cache_key] = texture
         return texture
         
     def find_sprite_sheet(self, sprite_name: str) -> Optional[str]:
@@ -153,7 +178,8 @@ class SpriteManager:
 
         # Use config scale as default if no scale provided
         if scale is None:
-            if sprite_name in self._sprite_configs[sheet_name]:
+            self.ensure_sprite_sheet(sheet_name)
+            if sprite_name in self._sprite_configs.get(sheet_name, {}):
                 _, _, _, _, config_scale = self._sprite_configs[sheet_name][sprite_name]
                 scale = config_scale
             else: